@@ -7,7 +7,7 @@ import asyncio
 import json
 from collections import deque
 from websockets.exceptions import ConnectionClosed
-from multiprocessing import Queue  # 确保导入Queue
+from queue import Queue  # 线程间传递任务，无需跨进程序列化
 
 # PyQt5相关导入
 import sys
@@ -69,7 +69,7 @@ class AsyncWorker(QThread):
         super().__init__(parent)
         self.id = 0
         self.is_running = False
-        # 修复1：恢复为multiprocessing.Queue（支持empty()方法）
+        # 同一进程内的线程间队列，避免multiprocessing.Queue的pickle和管道开销
         self.realtime_queue = Queue()
         self.realtime_thread = None
         self.text_print_en = ""  # 英文翻译累积
@@ -84,6 +84,7 @@ class AsyncWorker(QThread):
         self.translation_tasks = deque()
         self.task_counter = 0
         self.last_processed_index = 0  # 上次处理位置
+        self._last_scan_pos = 0  # 上次扫描句子边界的结束位置（增量扫描）
         self.pending_text = ""  # 待处理文本
         self.last_text_receive_time = 0  # 最后接收文本时间
         self.device_index = device_index  # 手动选择的设备索引
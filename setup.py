@@ -79,6 +79,7 @@ setup(
         ],
         "translation": [
             "requests>=2.25.0",
+            "orjson>=3.8",
         ],
         "websocket": [
             "websockets>=10.0",
@@ -54,6 +54,7 @@ DEFAULT_OUTPUT_DIR = None
 # 文本处理相关常量
 SENTENCE_END_CHARS = ['，', '。', '！', '？', '.', '!', '?', ';', '；']
 PUNCTUATION_CHARS = '，。！？,.!?'
+PUNCTUATION_CHAR_SET = frozenset(PUNCTUATION_CHARS)
 
 # 颜色常量（科技感配色）
 TECH_CYAN = "#00ffff"
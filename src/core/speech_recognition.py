@@ -12,7 +12,7 @@ import json
 import logging
 from collections import deque
 from websockets.exceptions import ConnectionClosed
-from multiprocessing import Queue
+from queue import Queue
 from typing import Optional
 
 from PyQt5.QtCore import QTimer, pyqtSignal, QThread
@@ -8,11 +8,21 @@ import time
 import re
 from typing import Tuple, Optional, List
 
-from ..config.constants import SENTENCE_END_CHARS, PUNCTUATION_CHARS
+from ..config.constants import SENTENCE_END_CHARS, PUNCTUATION_CHAR_SET
 from ..models.translation_models import TranslationTask
 
 logger = logging.getLogger(__name__)
 
+# 句子结束标点的正则，用于从前向后查找第一个句子边界
+_SENTENCE_END_RE = re.compile('[' + re.escape(''.join(SENTENCE_END_CHARS)) + ']')
+
+# 作为句子边界的数字模式（与extract_complete_sentence中的规则一致）
+_NUMBER_PATTERNS = [
+    re.compile(r'\d{4}'),  # 4位数字年份
+    re.compile(r'\d{1,2}/\d{1,2}/\d{4}'),  # 日期格式
+    re.compile(r'\d{1,2}:\d{2}'),  # 时间格式
+]
+
 
 class TextProcessingService:
     """文本处理服务类"""
@@ -68,6 +78,33 @@ class TextProcessingService:
         
         return None, text
     
+    def extract_first_complete_sentence(self, text: str) -> Tuple[Optional[str], str]:
+        """
+        提取第一个完整句子（从前向后查找，找到即停止），支持标点符号和数字模式边界
+        
+        边界规则与extract_complete_sentence相同，区别只在于取最早出现的边界而不是最后一个
+        
+        Args:
+            text: 输入的文本内容
+            
+        Returns:
+            (sentence, remaining) - 第一个完整句子和剩余文本，sentence为None表示没有找到完整句子
+        """
+        if not text:
+            return None, ""
+        
+        # 标点和各数字模式各自的第一个匹配中，结束位置最早的即为第一个句子边界
+        end_positions = [
+            match.end()
+            for match in (pattern.search(text) for pattern in (_SENTENCE_END_RE, *_NUMBER_PATTERNS))
+            if match is not None
+        ]
+        if not end_positions:
+            return None, text
+        
+        end_pos = min(end_positions)
+        return text[:end_pos], text[end_pos:]
+    
     def is_punctuation_only(self, text: str) -> bool:
         """
         检查文本是否只包含标点符号
@@ -78,9 +115,13 @@ class TextProcessingService:
         Returns:
             是否只包含标点符号
         """
-        if not text or not text.strip():
+        if not text:
             return True
-        return all(char in PUNCTUATION_CHARS for char in text.strip())
+        stripped = text.strip()
+        if not stripped:
+            return True
+        # 先对字符去重，再做集合差运算，只需比较不同的字符
+        return not (set(stripped) - PUNCTUATION_CHAR_SET)
     
     def process_text_with_dual_channels(self, worker_instance, text_print: str, 
                                        last_processed_index: int, pending_text: str,
@@ -198,6 +239,12 @@ def extract_complete_sentence(text: str) -> Tuple[Optional[str], str]:
     return service.extract_complete_sentence(text)
 
 
+def extract_first_complete_sentence(text: str) -> Tuple[Optional[str], str]:
+    """兼容性函数包装"""
+    service = TextProcessingService()
+    return service.extract_first_complete_sentence(text)
+
+
 def process_text_with_dual_channels(worker_instance, text_print: str, last_processed_index: int,
                                    pending_text: str, translation_tasks, realtime_queue,
                                    task_counter: int, args, incremental_queue, 
@@ -4,8 +4,10 @@ Translation Service Module
 """
 
 import logging
+import re
 import requests
 import time
+from queue import Empty
 from typing import Dict, Optional
 from PyQt5.QtCore import QThread, pyqtSignal
 
@@ -17,6 +19,11 @@ from ..config.constants import (
 
 logger = logging.getLogger(__name__)
 
+# 翻译结果中需要清除的乱码序列（"♪"等被错误解码后的残留），出现新的乱码序列时在此追加；
+# 按完整序列匹配，单独出现的"â"、"ª"等正常字符（如"pâté"、"1ª"）不受影响
+_GARBLED_SEQUENCES = ('âª',)
+_GARBLED_RE = re.compile('|'.join(map(re.escape, _GARBLED_SEQUENCES)))
+
 
 class TranslationService:
     """翻译服务类"""
@@ -73,7 +80,7 @@ class TranslationService:
                 
                 if translated_text:
                     # 清理异常字符
-                    translated_text = translated_text.replace("âª", "").strip()
+                    translated_text = _GARBLED_RE.sub('', translated_text).strip()
                     if not translated_text:
                         translated_text = text
                     
@@ -127,33 +134,36 @@ class RealTimeTranslationThread(QThread):
     def run(self):
         """线程主循环"""
         while self.is_running:
-            task_processed = False
             try:
                 # 检查队列是否还在有效状态
                 try:
-                    if not self.queue.empty():
-                        task = self.queue.get_nowait()
-                        task_start_time = time.time()
-                        queue_wait_time = task_start_time - task.create_time
+                    # 阻塞等待任务，超时后回到循环检查运行状态
+                    try:
+                        task = self.queue.get(timeout=0.05)
+                    except Empty:
+                        continue
+                    if task is None:  # 停止哨兵
+                        break
+
+                    task_start_time = time.time()
+                    queue_wait_time = task_start_time - task.create_time
+                    
+                    self.logger.info(f"开始处理翻译任务: {task.text} (队列等待: {queue_wait_time:.3f}秒)")
+                    
+                    if task.text and task.text.strip():
+                        # 调用翻译服务
+                        translated_text = self.translation_service.translate_text(task.text)
+                        
+                        if translated_text:
+                            task.translated_text = translated_text
+                            total_time = time.time() - task.create_time
+                            self.logger.info(f"翻译完成: {task.text} -> {translated_text} (总计: {total_time:.3f}秒)")
+                        else:
+                            task.translated_text = task.text  # 翻译失败时使用原文
+                            self.logger.warning(f"翻译失败，使用原文: {task.text}")
                         
-                        self.logger.info(f"开始处理翻译任务: {task.text} (队列等待: {queue_wait_time:.3f}秒)")
+                        self.translation_done.emit(task)
                         
-                        if task.text and task.text.strip():
-                            task_processed = True
-                            
-                            # 调用翻译服务
-                            translated_text = self.translation_service.translate_text(task.text)
-                            
-                            if translated_text:
-                                task.translated_text = translated_text
-                                total_time = time.time() - task.create_time
-                                self.logger.info(f"翻译完成: {task.text} -> {translated_text} (总计: {total_time:.3f}秒)")
-                            else:
-                                task.translated_text = task.text  # 翻译失败时使用原文
-                                self.logger.warning(f"翻译失败，使用原文: {task.text}")
-                            
-                            self.translation_done.emit(task)
-                            
                 except (OSError, ValueError) as queue_error:
                     # 队列已关闭或无效，停止线程
                     if "handle is closed" in str(queue_error) or "closed" in str(queue_error).lower():
@@ -164,17 +174,6 @@ class RealTimeTranslationThread(QThread):
                         self.logger.error(f"队列操作错误: {str(queue_error)}")
                         self.msleep(10)
                         continue
-                except Exception as queue_error:
-                    # 处理get_nowait可能抛出的异常
-                    if "Empty" in str(queue_error) or "empty" in str(queue_error).lower():
-                        # 队列为空，正常情况
-                        pass
-                    else:
-                        self.logger.error(f"获取队列任务错误: {str(queue_error)}")
-                    
-                    # 如果没有处理任务，才等待
-                    if not task_processed:
-                        self.msleep(1)
                         
             except Exception as e:
                 self.logger.error(f"实时翻译线程错误: {str(e)}")
@@ -188,5 +187,9 @@ class RealTimeTranslationThread(QThread):
         """停止翻译线程"""
         self.logger.info("停止翻译线程")
         self.is_running = False
+        try:
+            self.queue.put(None)  # 唤醒阻塞中的get()
+        except (OSError, ValueError):
+            pass
         self.quit()
         self.wait()
\ No newline at end of file
@@ -99,6 +99,33 @@ class TestTextProcessingService(unittest.TestCase):
         self.assertEqual(sentence, "第一句。第二句！第三句？")
         self.assertEqual(remaining, "剩余部分")
     
+    def testExtractFirstCompleteSentence(self):
+        """测试提取第一个完整句子"""
+        text = "第一句。第二句！剩余部分"
+        sentence, remaining = self.textService.extract_first_complete_sentence(text)
+        
+        self.assertEqual(sentence, "第一句。")
+        self.assertEqual(remaining, "第二句！剩余部分")
+        
+        # 数字模式与extract_complete_sentence一样作为句子边界
+        sentence, remaining = self.textService.extract_first_complete_sentence("会议在10:30开始，请准时")
+        self.assertEqual(sentence, "会议在10:30")
+        self.assertEqual(remaining, "开始，请准时")
+        
+        sentence, remaining = self.textService.extract_first_complete_sentence("今天是12/05/2024星期四")
+        self.assertEqual(sentence, "今天是12/05/2024")
+        self.assertEqual(remaining, "星期四")
+        
+        # 没有完整句子
+        sentence, remaining = self.textService.extract_first_complete_sentence("未完成的句子")
+        self.assertIsNone(sentence)
+        self.assertEqual(remaining, "未完成的句子")
+        
+        # 空文本
+        sentence, remaining = self.textService.extract_first_complete_sentence("")
+        self.assertIsNone(sentence)
+        self.assertEqual(remaining, "")
+    
     def testIsPunctuationOnly(self):
         """测试是否只包含标点符号"""
         # 只有标点符号
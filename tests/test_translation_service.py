@@ -42,6 +42,30 @@ class TestTranslationService(unittest.TestCase):
             self.assertEqual(result, "Hello World")
             mockPost.assert_called_once()
     
+    def testTranslateTextCleansGarbledChars(self):
+        """测试清理翻译结果中的异常字符"""
+        with patch('requests.post') as mockPost:
+            mockResponse = Mock()
+            mockResponse.status_code = 200
+            mockResponse.json.return_value = {"translated_text": "âªHello Worldâª "}
+            mockPost.return_value = mockResponse
+
+            result = self.translationService.translate_text("你好世界")
+
+            self.assertEqual(result, "Hello World")
+
+    def testTranslateTextKeepsValidAccentedChars(self):
+        """测试单独出现的â、ª等正常字符不会被清除"""
+        with patch('requests.post') as mockPost:
+            mockResponse = Mock()
+            mockResponse.status_code = 200
+            mockResponse.json.return_value = {"translated_text": "pâté au château, 1ª"}
+            mockPost.return_value = mockResponse
+
+            result = self.translationService.translate_text("法式肉酱")
+
+            self.assertEqual(result, "pâté au château, 1ª")
+
     def testTranslateTextFailure(self):
         """测试失败的翻译请求"""
         with patch('requests.post') as mockPost:
@@ -174,7 +198,7 @@ class TestRealTimeTranslationThread(unittest.TestCase):
     
     def setUp(self):
         """测试前准备"""
-        from multiprocessing import Queue
+        from queue import Queue
         self.queue = Queue()
         self.translateApi = "http://localhost:8000/translate"
     
@@ -4,6 +4,7 @@
 """
 
 import logging
+import re
 import time
 
 # 导入翻译任务类
@@ -11,6 +12,32 @@ from translation_manager import TranslationTask
 
 logger = logging.getLogger(__name__)
 
+# 标点符号集合，用于判断文本是否只包含标点（集合成员判断在C层完成）
+_PUNCT_ONLY_SET = frozenset('，。！？,.!?')
+
+# 增量扫描时回退的字符数：最长的数字模式(dd/dd/dddd)为10个字符，
+# 回退9个字符即可覆盖跨越上次扫描边界的数字模式
+_SCAN_OVERLAP = 9
+
+# 句子结束标点
+_SENTENCE_END_CHARS = '，。！？.!?;；'
+
+# 作为句子边界的数字模式（预编译）
+_NUMBER_PATTERNS = [
+    re.compile(r'\d{4}'),  # 4位数字年份
+    re.compile(r'\d{1,2}/\d{1,2}/\d{4}'),  # 日期格式
+    re.compile(r'\d{1,2}:\d{2}'),  # 时间格式
+]
+
+def _find_last_sentence_end(text):
+    """返回text中最后一个句子结束标点的位置，没有则返回-1"""
+    end_pos = -1
+    for char in _SENTENCE_END_CHARS:
+        pos = text.rfind(char)  # 使用rfind查找最后一个出现的位置
+        if pos > end_pos:
+            end_pos = pos
+    return end_pos
+
 
 def extract_complete_sentence(text):
     """
@@ -26,26 +53,13 @@ def extract_complete_sentence(text):
     if not text:
         return None, ""
         
-    sentence_end_chars = ['，', '。', '！', '？', '.', '!', '?', ';', '；']
-    end_pos = -1
-
     # 查找最后一个标点符号位置
-    for char in sentence_end_chars:
-        pos = text.rfind(char)  # 使用rfind查找最后一个出现的位置
-        if pos > end_pos:
-            end_pos = pos
+    end_pos = _find_last_sentence_end(text)
 
     # 检查数字模式（年份等）
-    import re
-    number_patterns = [
-        r'\d{4}',  # 4位数字年份
-        r'\d{1,2}/\d{1,2}/\d{4}',  # 日期格式
-        r'\d{1,2}:\d{2}',  # 时间格式
-    ]
-    
     number_positions = []
-    for pattern in number_patterns:
-        matches = list(re.finditer(pattern, text))
+    for pattern in _NUMBER_PATTERNS:
+        matches = list(pattern.finditer(text))
         if matches:
             # 取最后一个匹配的位置
             last_match = matches[-1]
@@ -90,7 +104,7 @@ def process_text_with_dual_channels(self, text_print, last_processed_index, pend
     Returns:
         tuple: (has_complete_sentence, new_last_processed_index, new_pending_text, new_task_counter)
     """
-    self.last_text_receive_time = time.time()
+    self.last_text_receive_time = time.monotonic()
 
     if not text_print or len(text_print) <= last_processed_index:
         return False, last_processed_index, pending_text, task_counter
@@ -99,14 +113,28 @@ def process_text_with_dual_channels(self, text_print, last_processed_index, pend
     logger.info("未处理文本: %s", unprocessed_text)
 
     # 步骤1：检查是否有完整句子
-    sentence, remaining = extract_complete_sentence(unprocessed_text)
+    # 文本只会追加，上次扫描过且未找到句子边界的部分无需重复扫描，只扫描新追加的后缀
+    last_scan_pos = self._last_scan_pos
+    if last_scan_pos > len(text_print):  # 文本被重置
+        last_scan_pos = 0
+    scan_start = max(last_processed_index, last_scan_pos - _SCAN_OVERLAP)
+    # 起点落在数字串中间时退到该数字串开头（不早于上次处理位置），保证\d{4}等模式的
+    # 匹配对齐方式与从上次处理位置整体扫描一致（已扫描部分没有4位数字，最多回退3个字符）
+    while scan_start > last_processed_index and text_print[scan_start - 1].isdecimal():
+        scan_start -= 1
+    self._last_scan_pos = len(text_print)
+
+    sentence, remaining = extract_complete_sentence(text_print[scan_start:])
+    if sentence:
+        # 将句子还原为从上次处理位置开始的完整内容
+        sentence = text_print[last_processed_index:scan_start] + sentence
 
     if sentence:
         logger.info("检测到完整句子: %s", sentence)
         
         # 新增：过滤只包含标点符号的句子
-        punctuation_chars = '，。！？,.!?'
-        if sentence.strip() and all(char in punctuation_chars for char in sentence.strip()):
+        stripped = sentence.strip()
+        if stripped and _PUNCT_ONLY_SET.issuperset(stripped):
             logger.info(f"跳过翻译只包含标点符号的句子: {sentence}")
             # 更新处理位置但不发送翻译请求
             new_last_processed_index = last_processed_index + len(sentence)
@@ -153,42 +181,45 @@ def handle_timeout_with_dual_channels(self, is_running, last_text_receive_time,
     if not is_running:
         return
 
-    current_time = time.time()
-    if (current_time - last_text_receive_time >= args.timeout_seconds and
-            pending_text and pending_text.strip()):
-        logger.info(f"超时处理：{args.timeout_seconds}秒无新输入，强制翻译未完成文本: {pending_text}")
-
-        # 新增：过滤只包含标点符号的超时文本
-        punctuation_chars = '，。！？,.!?'
-        if all(char in punctuation_chars for char in pending_text.strip()):
-            logger.info(f"跳过翻译只包含标点符号的超时文本: {pending_text}")
-            # 更新状态但不发送翻译请求
-            self.last_processed_index = last_processed_index + len(pending_text)
-            self.pending_text = ""  # 清空已处理的文本
-            self.task_counter = task_counter
-            
-            # 清空在线通道任务
-            incremental_tasks.clear()
-            logger.info("已清空在线通道任务，跳过标点符号翻译")
-            
-            status_update_signal.emit(f"超时处理：{args.timeout_seconds}秒无新输入，跳过标点符号翻译")
-            return
-        
-        # 超时文本发送到离线通道，确保高质量翻译
-        self.offline_version += 1  # 增加离线版本号
-        timeout_task = TranslationTask(pending_text, task_counter, is_incremental=False, version=self.offline_version)
-        translation_tasks.append(timeout_task)
-        realtime_queue.put(timeout_task)
-        task_counter += 1
-        logger.info("超时文本已发送到离线通道进行完整翻译（版本: %d）", self.offline_version)
+    current_time = time.monotonic()
+    if current_time - last_text_receive_time < args.timeout_seconds or not pending_text:
+        return
+    stripped = pending_text.strip()
+    if not stripped:
+        return
+
+    logger.info(f"超时处理：{args.timeout_seconds}秒无新输入，强制翻译未完成文本: {pending_text}")
 
-        # 更新状态
+    # 新增：过滤只包含标点符号的超时文本
+    if _PUNCT_ONLY_SET.issuperset(stripped):
+        logger.info(f"跳过翻译只包含标点符号的超时文本: {pending_text}")
+        # 更新状态但不发送翻译请求
         self.last_processed_index = last_processed_index + len(pending_text)
         self.pending_text = ""  # 清空已处理的文本
         self.task_counter = task_counter
         
-        # 清空在线通道任务，避免与超时任务冲突
+        # 清空在线通道任务
         incremental_tasks.clear()
-        logger.info("已清空在线通道任务，超时文本优先处理")
+        logger.info("已清空在线通道任务，跳过标点符号翻译")
         
-        status_update_signal.emit(f"超时处理：{args.timeout_seconds}秒无新输入，已翻译未完成文本")
\ No newline at end of file
+        status_update_signal.emit(f"超时处理：{args.timeout_seconds}秒无新输入，跳过标点符号翻译")
+        return
+    
+    # 超时文本发送到离线通道，确保高质量翻译
+    self.offline_version += 1  # 增加离线版本号
+    timeout_task = TranslationTask(pending_text, task_counter, is_incremental=False, version=self.offline_version)
+    translation_tasks.append(timeout_task)
+    realtime_queue.put(timeout_task)
+    task_counter += 1
+    logger.info("超时文本已发送到离线通道进行完整翻译（版本: %d）", self.offline_version)
+
+    # 更新状态
+    self.last_processed_index = last_processed_index + len(pending_text)
+    self.pending_text = ""  # 清空已处理的文本
+    self.task_counter = task_counter
+    
+    # 清空在线通道任务，避免与超时任务冲突
+    incremental_tasks.clear()
+    logger.info("已清空在线通道任务，超时文本优先处理")
+    
+    status_update_signal.emit(f"超时处理：{args.timeout_seconds}秒无新输入，已翻译未完成文本")
\ No newline at end of file
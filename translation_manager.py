@@ -1,104 +1,143 @@
 """翻译任务管理模块"""
 import logging
+import re
 import requests
+from requests.adapters import HTTPAdapter
+import threading
 import time  # 用于计时
+from concurrent.futures import ThreadPoolExecutor
+from queue import Empty
 from datetime import datetime
 from PyQt5.QtCore import QThread, pyqtSignal
 
 logger = logging.getLogger("Client")
 
+# 翻译结果中需要清除的乱码序列（"♪"等被错误解码后的残留），出现新的乱码序列时在此追加；
+# 按完整序列匹配，单独出现的"â"、"ª"等正常字符（如"pâté"、"1ª"）不受影响
+_GARBLED_SEQUENCES = ('âª',)
+_GARBLED_RE = re.compile('|'.join(map(re.escape, _GARBLED_SEQUENCES)))
+
+# 优先使用orjson进行JSON序列化/解析，未安装时回退到标准库json
+try:
+    import orjson
+
+    _json_dumps = orjson.dumps
+    _json_loads = orjson.loads
+except ImportError:
+    import json
+
+    def _json_dumps(obj):
+        return json.dumps(obj, ensure_ascii=False).encode('utf-8')
+
+    _json_loads = json.loads
+
 
 class TranslationTask:
     def __init__(self, text, task_id, is_incremental=False, version=None):
         self.text = text  # 需要翻译的原始文本
         self.task_id = task_id  # 任务唯一标识符
         self.translated_text = ""  # 存储翻译结果
-        self.timestamp = datetime.now().strftime("%H:%M:%S.%f")[:-3]  # 时间戳
-        self.create_time = time.time()  # 任务创建的精确时间戳
+        self.create_time = time.monotonic()  # 任务创建时间（单调时钟，用于计算耗时）
         self.is_incremental = is_incremental  # 是否为增量翻译任务
         self.version = version  # 版本号，用于解决异步时序问题
 
+    @property
+    def timestamp(self):
+        """任务创建时间的显示字符串，仅在访问时格式化"""
+        wall_time = time.time() - (time.monotonic() - self.create_time)
+        return datetime.fromtimestamp(wall_time).strftime("%H:%M:%S.%f")[:-3]
+
 
 class RealTimeTranslationThread(QThread):
     translation_done = pyqtSignal(TranslationTask)
 
-    def __init__(self, queue, translate_api, parent=None):
+    def __init__(self, queue, translate_api, parent=None, max_workers=4):
         super().__init__(parent)
         self.queue = queue
         self.translate_api = translate_api
         self.is_running = True
         self.translation_cache = {}  # 翻译缓存
         self.request_count = 0  # 请求计数器
+        self._inflight = {}  # 进行中的请求: 文本 -> 等待结果的(序号, 任务)列表
+        # 最近一次翻译结果的热点缓存 (文本, 译文)：字幕流经常重复最后一句，命中时无需查字典
+        self._last_hit = (None, None)
+
+        # 并发发送翻译请求，网络等待不再串行阻塞后续任务
+        self._pool = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="translate")
+        self._lock = threading.Lock()  # 保护缓存、进行中请求和结果重排序状态
+        self._next_seq = 0  # 下一个出队任务的序号（仅由本线程修改）
+        self._emit_seq = 0  # 下一个应发送结果的序号
+        self._ready = {}  # 已完成但尚未按序发送的结果: 序号 -> 任务（None表示无需发送）
+        # 串行化结果发送：在_lock之外发信号，同时保证不同线程取出的结果按序发出
+        self._emit_lock = threading.Lock()
+
+        # 复用HTTP连接（keep-alive），避免每次请求重新建立TCP连接
+        self.session = requests.Session()
+        self.session.headers.update({'Content-Type': 'application/json; charset=utf-8'})
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=max_workers)
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
 
     def run(self):
+        try:
+            self._dispatch_loop()
+        finally:
+            # 等待已提交的请求完成，确保线程结束后不再发送结果
+            self._pool.shutdown(wait=True)
+
+    def _dispatch_loop(self):
         while self.is_running:
-            task_processed = False  # 在循环外部初始化，修复变量作用域问题
             try:
                 # 检查队列是否还在有效状态
                 try:
-                    # 优化：减少队列检查延迟，使用非阻塞方式
-                    if not self.queue.empty():
-                        task = self.queue.get_nowait()  # 使用非阻塞获取
-                        task_start_time = time.time()  # 记录任务开始处理时间
-                        queue_wait_time = task_start_time - task.create_time  # 计算队列等待时间
-                        logger.info("开始处理翻译任务 #%d: %s (队列等待: %.3f秒)", self.request_count + 1, task.text, queue_wait_time)
-                        
-                        if task.text and task.text.strip():
-                            task_processed = True  # 标记已处理任务
-                            # 检查缓存
-                            cache_key = task.text.strip()
-                            if cache_key in self.translation_cache:
-                                task.translated_text = self.translation_cache[cache_key]
-                                self.translation_done.emit(task)
-                                logger.info("使用缓存翻译: %s -> %s", task.text, task.translated_text)
+                    # 阻塞等待任务，超时后回到循环检查运行状态，避免空转占用CPU
+                    try:
+                        task = self.queue.get(timeout=0.05)
+                    except Empty:
+                        continue
+                    if task is None:  # 停止哨兵
+                        logger.info("收到停止信号，退出翻译线程")
+                        break
+
+                    # 按出队顺序编号，结果按此顺序发送，保证字幕顺序不因并发而错乱
+                    seq = self._next_seq
+                    self._next_seq += 1
+
+                    cache_key = task.text.strip() if task.text else ""
+                    if not cache_key:
+                        self._complete(seq, None)
+                        continue
+
+                    # 先查缓存：命中时直接返回，跳过计时和请求相关的处理
+                    last_key, last_val = self._last_hit
+                    if cache_key == last_key:
+                        task.translated_text = last_val
+                        self._complete(seq, task)
+                        continue
+
+                    with self._lock:
+                        # 检查缓存
+                        cached = self.translation_cache.get(cache_key)
+                        if cached is None:
+                            # 相同文本的请求正在进行中：挂到等待列表，结果返回时一并发送
+                            waiters = self._inflight.get(cache_key)
+                            if waiters is not None:
+                                waiters.append((seq, task))
+                                logger.info("合并重复翻译请求: %s", task.text)
                                 continue
+                            self._inflight[cache_key] = [(seq, task)]
 
-                            # 调用翻译API，优化超时和编码处理
-                            try:
-                                self.request_count += 1
-                                request_id = self.request_count
-                                start_time = time.time()  # 记录开始时间
-                                logger.info("发送翻译请求 #%d: %s", request_id, task.text)
-
-                                payload = {"text": task.text}
-                                # 优化：进一步降低超时时间，提升实时性
-                                response = requests.post(
-                                    self.translate_api, 
-                                    json=payload, 
-                                    timeout=1.2,  # 从1.5秒降低到1.2秒，进一步提升响应速度
-                                    headers={'Content-Type': 'application/json; charset=utf-8'}
-                                )
-
-                                elapsed_time = time.time() - start_time
-                                logger.info("翻译API响应时间 #%d: %.3f秒", request_id, elapsed_time)
-
-                                if response.status_code == 200:
-                                    result = response.json()
-                                    translated_text = result.get("translated_text", "")
-                                    if translated_text:
-                                        # 清理异常字符
-                                        translated_text = translated_text.replace("âª", "").strip()
-                                        if not translated_text:  # 如果清理后为空，使用原文
-                                            translated_text = task.text
-                                            
-                                        task.translated_text = translated_text
-                                        # 更新缓存（限制大小）
-                                        self.translation_cache[cache_key] = translated_text
-                                        if len(self.translation_cache) > 1000:
-                                            oldest_key = next(iter(self.translation_cache))
-                                            del self.translation_cache[oldest_key]
-                                        
-                                        self.translation_done.emit(task)
-                                        total_time = time.time() - task.create_time  # 计算总耗时
-                                        logger.info("翻译完成 #%d: %s -> %s (API: %.3f秒, 总计: %.3f秒)", request_id, task.text, task.translated_text, elapsed_time, total_time)
-                                    else:
-                                        logger.warning("翻译API返回空结果 #%d", request_id)
-                                else:
-                                    logger.error("翻译API错误 #%d: HTTP %s", request_id, response.status_code)
-                            except Exception as e:
-                                # 修复：确保在异常情况下正确访问请求计数器
-                                req_id = getattr(self, 'request_count', 0)  # 安全获取请求计数器
-                                logger.error("翻译请求错误 #%d: %s", req_id, str(e))
+                    if cached is not None:
+                        self._last_hit = (cache_key, cached)
+                        task.translated_text = cached
+                        self._complete(seq, task)
+                        logger.info("使用缓存翻译: %s -> %s", task.text, task.translated_text)
+                        continue
+
+                    task_start_time = time.monotonic()  # 记录任务开始处理时间
+                    queue_wait_time = task_start_time - task.create_time  # 计算队列等待时间
+                    logger.info("开始处理翻译任务 #%d: %s (队列等待: %.3f秒)", self.request_count + 1, task.text, queue_wait_time)
+                    self._pool.submit(self._translate_one, cache_key, task)
                 except (OSError, ValueError) as queue_error:
                     # 队列已关闭或无效，停止线程
                     if "handle is closed" in str(queue_error) or "closed" in str(queue_error).lower():
@@ -110,17 +149,6 @@ class RealTimeTranslationThread(QThread):
                         # 短暂停顿后重试
                         self.msleep(10)  # 从50ms减少到10ms，提升响应速度
                         continue
-                except Exception as queue_error:
-                    # 处理get_nowait可能抛出的异常
-                    if "Empty" in str(queue_error) or "empty" in str(queue_error).lower():
-                        # 队列为空，正常情况
-                        pass
-                    else:
-                        logger.error("获取队列任务错误: %s", str(queue_error))
-
-                    # 如果没有处理任务，才等待；如果处理了任务，立即检查下一个
-                    if not task_processed:
-                        self.msleep(1)  # 只有在没有任务时才等待
             except Exception as e:
                 logger.error("实时翻译线程错误: %s", str(e))
                 # 如果是队列相关错误，停止线程
@@ -129,7 +157,93 @@ class RealTimeTranslationThread(QThread):
                     self.is_running = False
                     break
 
+    def _translate_one(self, cache_key, task):
+        """在线程池中调用翻译API，完成后将结果交给所有等待相同文本的任务"""
+        translated_text = None
+        try:
+            # 调用翻译API，优化超时和编码处理
+            with self._lock:
+                self.request_count += 1
+                request_id = self.request_count
+            start_time = time.monotonic()  # 记录开始时间
+            logger.info("发送翻译请求 #%d: %s", request_id, task.text)
+
+            body = _json_dumps({"text": task.text})
+            # 优化：进一步降低超时时间，提升实时性
+            response = self.session.post(
+                self.translate_api, 
+                data=body, 
+                timeout=1.2  # 从1.5秒降低到1.2秒，进一步提升响应速度
+            )
+
+            end_time = time.monotonic()
+            elapsed_time = end_time - start_time
+            logger.info("翻译API响应时间 #%d: %.3f秒", request_id, elapsed_time)
+
+            if response.status_code == 200:
+                result = _json_loads(response.content)
+                translated_text = result.get("translated_text", "")
+                if translated_text:
+                    # 清理异常字符
+                    translated_text = _GARBLED_RE.sub('', translated_text).strip()
+                    if not translated_text:  # 如果清理后为空，使用原文
+                        translated_text = task.text
+                    total_time = end_time - task.create_time  # 计算总耗时
+                    logger.info("翻译完成 #%d: %s -> %s (API: %.3f秒, 总计: %.3f秒)", request_id, task.text, translated_text, elapsed_time, total_time)
+                else:
+                    translated_text = None
+                    logger.warning("翻译API返回空结果 #%d", request_id)
+            else:
+                logger.error("翻译API错误 #%d: HTTP %s", request_id, response.status_code)
+        except Exception as e:
+            # 修复：确保在异常情况下正确访问请求计数器
+            req_id = getattr(self, 'request_count', 0)  # 安全获取请求计数器
+            logger.error("翻译请求错误 #%d: %s", req_id, str(e))
+        finally:
+            with self._lock:
+                waiters = self._inflight.pop(cache_key, [])
+                if translated_text:
+                    self._last_hit = (cache_key, translated_text)
+                    # 更新缓存（限制大小）
+                    self.translation_cache[cache_key] = translated_text
+                    if len(self.translation_cache) > 1000:
+                        oldest_key = next(iter(self.translation_cache))
+                        del self.translation_cache[oldest_key]
+            for seq, waiter in waiters:
+                if translated_text:
+                    waiter.translated_text = translated_text
+                    self._complete(seq, waiter)
+                else:
+                    self._complete(seq, None)
+
+    def _complete(self, seq, task):
+        """登记序号为seq的任务结果，并按出队顺序发送所有已就绪的结果
+        
+        增量任务不参与排序，完成后立即发送：接收方按version丢弃过期结果，
+        无需等待之前较慢的请求
+        """
+        with self._emit_lock:
+            ready_tasks = []
+            with self._lock:
+                if task is not None and task.is_incremental:
+                    ready_tasks.append(task)
+                    task = None  # 序号照常占位，之后的结果不会因此阻塞
+                self._ready[seq] = task
+                while self._emit_seq in self._ready:
+                    ready_task = self._ready.pop(self._emit_seq)
+                    self._emit_seq += 1
+                    if ready_task is not None:
+                        ready_tasks.append(ready_task)
+            # 释放_lock后再发信号，工作线程更新缓存时不必等待信号发送
+            for ready_task in ready_tasks:
+                self.translation_done.emit(ready_task)
+
     def stop(self):
         self.is_running = False
+        try:
+            self.queue.put(None)  # 唤醒阻塞中的get()，让线程立即退出
+        except (OSError, ValueError):
+            pass  # 队列已关闭，线程会在超时后自行退出
         self.quit()
-        self.wait()
\ No newline at end of file
+        self.wait()
+        self.session.close()
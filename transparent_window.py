@@ -4,10 +4,14 @@
 """
 
 import logging
+import re
 from collections import deque
+from contextlib import contextmanager
+from functools import lru_cache
+from html import escape
 from PyQt5.QtWidgets import QMainWindow, QWidget, QVBoxLayout, QLabel, QMenu
 from PyQt5.QtCore import Qt, QPoint, QTimer
-from PyQt5.QtGui import QShowEvent, QMouseEvent, QContextMenuEvent, QFont
+from PyQt5.QtGui import QShowEvent, QMouseEvent, QContextMenuEvent, QFont, QFontMetrics
 
 # 导入文本处理工具模块
 from text_utils import extract_complete_sentence
@@ -15,6 +19,40 @@ from text_utils import extract_complete_sentence
 logger = logging.getLogger(__name__)
 
 
+def _make_subtitle_font(size, is_chinese):
+    """创建字幕使用的加粗字体"""
+    font = QFont("Microsoft YaHei" if is_chinese else "Arial")
+    font.setPointSize(size)
+    font.setBold(True)
+    return font
+
+
+# 等待显示的句子对上限
+_MAX_PENDING_PAIRS = 32
+
+# 可能构成句子边界的字符：结束标点，或数字模式（年份/日期/时间都至少包含两个连续数字）
+_BOUNDARY_RE = re.compile(r'[，。！？.!?;；]|\d\d')
+
+
+@lru_cache(maxsize=1024)
+def _extract_cached(text):
+    """缓存句子提取结果：流式识别的部分结果经常重复出现相同的未处理文本"""
+    return extract_complete_sentence(text)
+
+
+def _split_complete_sentence(text):
+    """切分出完整句子；最常见的"还没有句子边界"情况只做一次正则扫描就返回"""
+    if _BOUNDARY_RE.search(text) is None:
+        return None, text
+    return _extract_cached(text)
+
+
+@lru_cache(maxsize=None)
+def _font_metrics(size, is_chinese):
+    """按(字号, 语言)缓存QFontMetrics对象"""
+    return QFontMetrics(_make_subtitle_font(size, is_chinese))
+
+
 class TransparentSubtitleWindow(QMainWindow):
     def __init__(self, on_close_callback=None):
         super().__init__()
@@ -44,10 +82,13 @@ class TransparentSubtitleWindow(QMainWindow):
             self.setAttribute(Qt.WA_TranslucentBackground)
         
         # 设置窗口大小和位置（固定长度为屏幕宽度的80%，位于屏幕最下方）
+        # 屏幕几何信息只在初始化和屏幕切换时获取，避免每次居中/测量都查询QScreen
+        self._screen_geometry = None
+        self._screen_signal_connected = False
         screen = self.screen()
         if screen is not None:
-            screen_geometry = screen.availableGeometry()
-            self.default_width = int(screen_geometry.width() * 0.8)  # 默认宽度
+            self._update_screen_geometry(screen)
+            screen_geometry = self._screen_geometry
             self.default_height = 120
             
             # 固定底部距离（距离屏幕底部180像素）
@@ -65,6 +106,7 @@ class TransparentSubtitleWindow(QMainWindow):
         else:
             # 如果无法获取屏幕信息，使用默认值
             self.default_width = 1024
+            self._max_width = 1920  # 默认最大宽度
             self.default_height = 120
             self.fixed_bottom_distance = 180
             self.resize(self.default_width, self.default_height)
@@ -75,47 +117,35 @@ class TransparentSubtitleWindow(QMainWindow):
         self.setCentralWidget(self.central_widget)
         self.main_layout = QVBoxLayout(self.central_widget)
         
-        # 创建文本显示框
-        self.chinese_label = QLabel("")
-        self.english_label = QLabel("")
+        # 创建文本显示框：中英文两行放在同一个富文本标签中，
+        # 每次更新只触发一个控件的样式计算、布局和重绘
+        self.subtitle_label = QLabel("")
+        self.subtitle_label.setTextFormat(Qt.TextFormat.RichText)
+        self._display_chinese = ""  # 标签中当前显示的中文
+        self._display_english = ""  # 标签中当前显示的英文
         
         # 设置字体和样式
-        self.font_size = 24
-        self.set_font_size(self.font_size)
+        self.font_size = None  # 由set_font_size设置
+        self.set_font_size(24)
         
         # 禁用自动换行，让文本在一行显示
-        self.chinese_label.setWordWrap(False)
-        self.english_label.setWordWrap(False)
+        self.subtitle_label.setWordWrap(False)
         
-        # 科技感半透明样式 - 深色背景带发光效果
-        chinese_style = """
-            color: #00ffff;
+        # 科技感半透明样式 - 深色背景（中英文颜色由富文本行内样式指定）
+        subtitle_style = """
             background-color: rgba(10, 10, 40, 0.85);
-            padding: 15px 25px;
-            border-radius: 12px;
-            border: 2px solid rgba(0, 255, 255, 0.4);
-            text-shadow: 0 0 10px rgba(0, 255, 255, 0.7);
-        """
-        
-        english_style = """
-            color: #ff00ff;
-            background-color: rgba(40, 10, 40, 0.85);
             padding: 12px 25px;
             border-radius: 12px;
-            border: 2px solid rgba(255, 0, 255, 0.4);
-            text-shadow: 0 0 10px rgba(255, 0, 255, 0.7);
+            border: 2px solid rgba(0, 255, 255, 0.4);
         """
         
-        self.chinese_label.setStyleSheet(chinese_style)
-        self.english_label.setStyleSheet(english_style)
+        self.subtitle_label.setStyleSheet(subtitle_style)
         
         # 设置文本对齐
-        self.chinese_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        self.english_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        self.subtitle_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
         
         # 添加到布局
-        self.main_layout.addWidget(self.chinese_label)
-        self.main_layout.addWidget(self.english_label)
+        self.main_layout.addWidget(self.subtitle_label)
         
         # 设置布局间距
         self.main_layout.setSpacing(8)
@@ -125,13 +155,19 @@ class TransparentSubtitleWindow(QMainWindow):
         self.opacity = 0.95
         self.setWindowOpacity(self.opacity)
         
+        # 右键菜单（首次右键时创建）
+        self._context_menu = None
+        
         # 初始化拖动相关变量
         self.dragging = False
         self.drag_position = QPoint()
         
         # 初始化文本缓存和句子队列
-        self.chinese_text_buffer = ""  # 中文文本缓存
-        self.english_text_buffer = ""  # 英文文本缓存
+        # 文本缓存只保存未处理的尾部，已处理的前缀在提取句子后丢弃，偏移量记录丢弃的长度
+        self.chinese_text_buffer = ""  # 中文文本缓存（未处理部分）
+        self.english_text_buffer = ""  # 英文文本缓存（未处理部分）
+        self.chinese_text_offset = 0  # 中文已丢弃的前缀长度（相对完整文本）
+        self.english_text_offset = 0  # 英文已丢弃的前缀长度（相对完整文本）
         self.chinese_sentence_queue = deque()  # 中文句子队列
         self.english_sentence_queue = deque()  # 英文句子队列
         self.current_chinese_sentence = ""  # 当前显示的中文句子
@@ -139,17 +175,16 @@ class TransparentSubtitleWindow(QMainWindow):
         self.chinese_processed_length = 0  # 中文已处理文本长度
         self.english_processed_length = 0  # 英文已处理文本长度
         # 新增：配对队列和相关变量
-        self.paired_sentence_queue = deque()  # 存储(中文, 英文)句子对
+        # 配对句子分别存放在两个并行队列中（同一下标为一对），不再为每对创建元组
+        # 队列有上限：识别速度超过显示速度时丢弃最旧的句子对，过时的字幕不如不显示
+        self._cn_queue = deque(maxlen=_MAX_PENDING_PAIRS)  # 配对的中文句子
+        self._en_queue = deque(maxlen=_MAX_PENDING_PAIRS)  # 配对的英文句子
         self.chinese_sentence_buffer = ""     # 中文句子缓存（用于配对）
-        self.english_sentence_buffer = ""     # 英文句子缓存（用于配对）
+        self._en_parts = []                   # 英文句子缓存片段（用于配对，使用时以空格连接）
+        self._en_parts_length = 0             # 片段以空格连接后的总长度
         self.last_chinese_sentence = ""       # 上一个中文句子
         self.last_english_sentence = ""       # 上一个英文句子
                 
-        # 初始化显示定时器（每2秒检查一次是否需要更新句子）
-        self.display_timer = QTimer()
-        self.display_timer.timeout.connect(self.update_display)
-        self.display_timer.start(2000)  # 每2秒检查一次
-        
         # 记录当前是否正在显示长句子
         self.is_showing_long_sentence = False
         
@@ -160,77 +195,79 @@ class TransparentSubtitleWindow(QMainWindow):
 
     def calculate_text_width(self, text, is_chinese=True):
         """计算文本所需的宽度"""
-        if not text:
+        # 空文本或纯空白不需要测量（不会超过默认宽度），直接返回
+        if not text or text.isspace():
             return 0
             
-        # 创建临时标签来计算文本宽度
-        temp_label = QLabel(text)
-        if is_chinese:
-            font = QFont("Microsoft YaHei")
-        else:
-            font = QFont("Arial")
-        font.setPointSize(self.font_size)
-        font.setBold(True)
-        temp_label.setFont(font)
-        
-        # 禁用自动换行以确保正确计算单行宽度
-        temp_label.setWordWrap(False)
-        
-        # 计算理想宽度（文本实际需要的宽度）
-        text_width = temp_label.sizeHint().width() + 50  # 加上边距
-        
-        # 限制最大宽度不超过屏幕宽度的95%
-        screen = self.screen()
-        if screen is not None:
-            max_width = int(screen.availableGeometry().width() * 0.95)
-        else:
-            max_width = 1920  # 默认最大宽度
-        return min(text_width, max_width)
+        # 直接用当前字号的字体度量计算单行宽度（加上边距），不超过屏幕宽度的95%
+        metrics = self._cn_metrics if is_chinese else self._en_metrics
+        return min(metrics.horizontalAdvance(text) + 50, self._max_width)
 
     def adjust_window_width(self, new_sentence, is_chinese=True):
         """根据新句子内容调整窗口宽度"""
         # 计算新句子所需的宽度
         required_width = self.calculate_text_width(new_sentence, is_chinese)
         
-        logger.info(f"句子: '{new_sentence}', 需要宽度: {required_width}px, 当前宽度: {self.width()}px, 默认宽度: {self.default_width}px")
+        logger.info("句子: '%s', 需要宽度: %spx, 当前宽度: %spx, 默认宽度: %spx",
+                    new_sentence, required_width, self.width(), self.default_width)
         
-        # 如果新句子宽度超过默认宽度，调整窗口大小
+        self._apply_width(required_width)
+
+    def _apply_width(self, required_width):
+        """按已测量好的宽度调整窗口：超过默认宽度时扩展，否则恢复默认宽度"""
         if required_width > self.default_width:
-            self.is_showing_long_sentence = True
-            
-            # 保存当前底部位置
-            current_bottom = self.geometry().bottom()
-            screen = self.screen()
-            if screen is not None:
-                screen_height = screen.availableGeometry().height()
-                current_bottom_distance = screen_height - current_bottom
-            else:
-                current_bottom_distance = 180  # 默认值
-            
-            self.resize(required_width, self.default_height)  # 始终使用默认高度
-            
+            if required_width != self.width():
+                self.resize(required_width, self.default_height)  # 始终使用默认高度
             # 重新居中窗口，但保持底部位置不变
             self.center_on_screen_fixed_bottom()
-            logger.info(f"窗口宽度调整为: {required_width}px, 底部距离保持: {self.fixed_bottom_distance}px")
+            self.is_showing_long_sentence = True
+            logger.info("窗口宽度调整为: %spx, 底部距离保持: %spx", required_width, self.fixed_bottom_distance)
         else:
-            # 如果新句子不需要调整宽度，但当前窗口是扩展状态，则恢复默认宽度
-            if self.width() > self.default_width:
-                self.restore_default_width()
-            self.is_showing_long_sentence = False
-            logger.info(f"句子宽度正常，保持默认宽度: {self.default_width}px")
+            self.restore_default_width()
+
+    @contextmanager
+    def _batched_updates(self):
+        """暂停窗口重绘，退出时合并为一次重绘；嵌套调用时由最外层恢复"""
+        if not self.updatesEnabled():
+            yield
+            return
+        self.setUpdatesEnabled(False)
+        try:
+            yield
+        finally:
+            self.setUpdatesEnabled(True)  # 重新启用时Qt会自动调度一次update()
 
     def restore_default_width(self):
         """恢复窗口到默认宽度"""
-        self.resize(self.default_width, self.default_height)  # 始终使用默认高度
-        self.center_on_screen_fixed_bottom()  # 使用固定底部位置的居中方法
+        with self._batched_updates():
+            # 尺寸未变化时跳过resize，避免无意义的重新布局和重绘
+            if self.width() != self.default_width or self.height() != self.default_height:
+                self.resize(self.default_width, self.default_height)  # 始终使用默认高度
+            self.center_on_screen_fixed_bottom()  # 使用固定底部位置的居中方法
         self.is_showing_long_sentence = False
         logger.info("窗口宽度恢复到默认大小")
 
-    def center_on_screen(self):
-        screen = self.screen()
+    def _update_screen_geometry(self, screen):
+        """缓存屏幕可用区域及由其推导的默认宽度和字幕最大宽度"""
+        self._screen_geometry = screen.availableGeometry()
+        self.default_width = int(self._screen_geometry.width() * 0.8)  # 默认宽度（屏幕宽度的80%）
+        self._max_width = int(self._screen_geometry.width() * 0.95)  # 字幕最大宽度（屏幕宽度的95%）
+
+    def _on_screen_changed(self, screen):
+        """窗口移动到其他屏幕时刷新缓存的屏幕信息，按新屏幕调整宽度并重新居中"""
         if screen is None:
             return
-        screen_geometry = screen.availableGeometry()
+        self._update_screen_geometry(screen)
+        if self.is_showing_long_sentence:
+            # 正在显示长句：保持当前宽度，但不超过新屏幕的最大宽度
+            self._apply_width(min(self.width(), self._max_width))
+        else:
+            self.restore_default_width()
+
+    def center_on_screen(self):
+        screen_geometry = self._screen_geometry
+        if screen_geometry is None:
+            return
         window_geometry = self.frameGeometry()
         
         # 计算屏幕中心位置（保持底部位置不变）
@@ -244,10 +281,9 @@ class TransparentSubtitleWindow(QMainWindow):
 
     def center_on_screen_fixed_bottom(self):
         """使用固定底部位置的居中方法"""
-        screen = self.screen()
-        if screen is None:
+        screen_geometry = self._screen_geometry
+        if screen_geometry is None:
             return
-        screen_geometry = screen.availableGeometry()
         window_geometry = self.frameGeometry()
         
         # 计算屏幕中心位置
@@ -256,38 +292,36 @@ class TransparentSubtitleWindow(QMainWindow):
         # 保持固定的底部距离
         bottom_y = screen_geometry.height() - self.fixed_bottom_distance
         
+        # 位置未变化时跳过move
+        if self.x() == center_x and self.y() == bottom_y:
+            return
+        
         # 将窗口放在屏幕下方中间（保持底部位置固定）
         self.move(center_x, bottom_y)
-        logger.info(f"窗口重新居中，底部距离保持: {self.fixed_bottom_distance}px")
+        logger.info("窗口重新居中，底部距离保持: %spx", self.fixed_bottom_distance)
 
     def update_display(self):
-        """定时更新显示（每2秒调用一次）"""
+        """显示队列中的下一对句子（在新句子配对成功或当前句子显示结束时触发）"""
         # 检查配对句子队列 - 同时显示中英文
-        if self.paired_sentence_queue and not self.is_showing_sentence:
-            chinese_sentence, english_sentence = self.paired_sentence_queue.popleft()
+        if self._cn_queue and not self.is_showing_sentence:
+            chinese_sentence = self._cn_queue.popleft()
+            english_sentence = self._en_queue.popleft()
             
             # 更新当前显示的句子
             self.current_chinese_sentence = chinese_sentence
             self.current_english_sentence = english_sentence
             
-            # 同时显示中英文
-            self.chinese_label.setText(chinese_sentence)
-            self.english_label.setText(english_sentence)
-            
-            logger.info(f"同时显示中英文: 中文='{chinese_sentence}', 英文='{english_sentence}'")
-            
-            # 根据最长的句子调整窗口宽度
-            chinese_width = self.calculate_text_width(chinese_sentence, True)
-            english_width = self.calculate_text_width(english_sentence, False)
-            max_width = max(chinese_width, english_width, self.default_width)
+            logger.info("同时显示中英文: 中文='%s', 英文='%s'", chinese_sentence, english_sentence)
             
-            if max_width > self.default_width:
-                self.resize(max_width, self.default_height)
-                self.center_on_screen_fixed_bottom()
-                self.is_showing_long_sentence = True
-            else:
-                self.restore_default_width()
-                self.is_showing_long_sentence = False
+            # 更新文本、调整宽度和居中合并为一次重绘
+            with self._batched_updates():
+                # 同时显示中英文
+                self._show_subtitle(chinese_sentence, english_sentence)
+                
+                # 根据最长的句子调整窗口宽度
+                chinese_width = self.calculate_text_width(chinese_sentence, True)
+                english_width = self.calculate_text_width(english_sentence, False)
+                self._apply_width(max(chinese_width, english_width, self.default_width))
             
             # 设置显示状态和定时器
             self.is_showing_sentence = True
@@ -310,43 +344,58 @@ class TransparentSubtitleWindow(QMainWindow):
     def clear_current_sentence(self):
         """清除当前显示的句子，准备显示下一个"""
         self.is_showing_sentence = False
-        # 清空当前显示的句子内容
-        self.chinese_label.setText("")
-        self.english_label.setText("")
+        # 清空显示内容并恢复默认宽度，合并为一次重绘
+        with self._batched_updates():
+            self._show_subtitle("", "")
+            # 恢复默认窗口宽度
+            self.restore_default_width()
         self.current_chinese_sentence = ""
         self.current_english_sentence = ""
-        # 恢复默认窗口宽度
-        self.restore_default_width()
+        # 显示队列中等待的下一对句子
+        if self._cn_queue:
+            QTimer.singleShot(0, self.update_display)
 
     def update_chinese_text(self, text):
-        """更新中文文本（主窗口调用）"""
-        if text != self.chinese_text_buffer:
-            self.chinese_text_buffer = text
-            self.process_chinese_text()
-            # 尝试配对中英文句子
-            self.try_pair_sentences()
+        """更新中文文本（主窗口调用，text为完整文本）"""
+        # 只切出并比较未处理的尾部，每次更新的开销与新增内容相关而不是整段文本
+        unprocessed_text = text[self.chinese_text_offset:]
+        if unprocessed_text == self.chinese_text_buffer:
+            return
+        previous_text = self.chinese_text_buffer
+        self.chinese_text_buffer = unprocessed_text
+        
+        # 常见情况：只是在未处理文本后追加了内容，且新增部分不可能构成句子边界，
+        # 此时提取结果不会变化，无需重新提取和配对
+        if (previous_text and unprocessed_text.startswith(previous_text) and
+                _BOUNDARY_RE.search(unprocessed_text, len(previous_text) - 1) is None):
+            return
+        
+        self.process_chinese_text()
+        # 尝试配对中英文句子
+        self.try_pair_sentences()
 
     def update_english_text(self, text, is_incremental=False):
         """更新英文文本（主窗口调用），支持增量翻译和完整翻译的区分处理"""
-        logger.info(f"副窗口更新英文显示: {text} (增量: {is_incremental})")
+        logger.info("副窗口更新英文显示: %s (增量: %s)", text, is_incremental)
         
         if is_incremental:
             # 增量翻译：直接更新显示，不进行句子提取和配对
-            self.english_label.setText(text)
+            self._show_subtitle(self._display_chinese, text)
         else:
-            # 完整翻译：更新文本缓冲区并处理完整句子
-            if text != self.english_text_buffer:
-                self.english_text_buffer = text
+            # 完整翻译：更新文本缓冲区并处理完整句子（只切出并比较未处理的尾部）
+            unprocessed_text = text[self.english_text_offset:]
+            if unprocessed_text != self.english_text_buffer:
+                self.english_text_buffer = unprocessed_text
                 self.process_english_text()
                 # 尝试配对中英文句子
                 self.try_pair_sentences()
                 
                 # 统一更新显示内容
-                if self.english_sentence_buffer:
+                if self._en_parts:
                     # 只显示当前缓存句子的内容（不包含已处理的文本）
-                    display_text = self.english_sentence_buffer
+                    display_text = self._english_sentence_text()
                     # 更新字幕显示
-                    self.english_label.setText(display_text)
+                    self._show_subtitle(self._display_chinese, display_text)
 
     def process_chinese_text(self):
         """处理中文文本，提取完整句子到缓存"""
@@ -358,22 +407,23 @@ class TransparentSubtitleWindow(QMainWindow):
         if not text_to_process:
             return
             
-        # 从新增文本中提取完整句子
-        remaining_text = text_to_process
-        
-        while remaining_text:
-            sentence, remaining = extract_complete_sentence(remaining_text)
-            if sentence:
-                # 将完整句子添加到缓存（用于配对）
-                self.chinese_sentence_buffer = sentence
-                # 更新已处理长度（加上提取的句子长度）
-                self.chinese_processed_length += len(sentence)
-                remaining_text = remaining
-                logger.info(f"提取到中文句子: {sentence}")
-            else:
-                # 如果没有完整句子，等待更多文本
-                logger.info(f"未找到完整中文句子，等待更多文本: {remaining_text}")
-                break
+        # 从新增文本中提取完整句子（一次切分到最后一个句子边界，剩余部分不含边界）
+        sentence, remaining_text = _split_complete_sentence(text_to_process)
+        if sentence:
+            # 将完整句子添加到缓存（用于配对）
+            self.chinese_sentence_buffer = sentence
+            # 更新已处理长度（加上提取的句子长度）
+            self.chinese_processed_length += len(sentence)
+            logger.info("提取到中文句子: %s", sentence)
+        else:
+            # 如果没有完整句子，等待更多文本
+            logger.info("未找到完整中文句子，等待更多文本: %s", remaining_text)
+        
+        # 丢弃已处理的前缀，缓存只保留未处理部分
+        if self.chinese_processed_length:
+            self.chinese_text_buffer = self.chinese_text_buffer[self.chinese_processed_length:]
+            self.chinese_text_offset += self.chinese_processed_length
+            self.chinese_processed_length = 0
 
     def process_english_text(self):
         """处理英文文本，提取完整句子到缓存，支持累积显示机制"""
@@ -385,83 +435,114 @@ class TransparentSubtitleWindow(QMainWindow):
         if not text_to_process:
             return
             
-        # 从新增文本中提取完整句子
-        remaining_text = text_to_process
-        
-        while remaining_text:
-            sentence, remaining = extract_complete_sentence(remaining_text)
-            if sentence:
-                # 检查是否已经有缓存句子，如果有则替换（实现完整句子替换碎片化翻译）
-                if self.english_sentence_buffer:
-                    # 只有当新句子比缓存句子更长或更完整时才替换
-                    if len(sentence) > len(self.english_sentence_buffer) or sentence.endswith(('.', '!', '?')):
-                        logger.info(f"用完整句子替换碎片化翻译: '{self.english_sentence_buffer}' -> '{sentence}'")
-                        self.english_sentence_buffer = sentence
-                    else:
-                        # 如果新句子不更完整，则追加到现有句子后
-                        self.english_sentence_buffer += " " + sentence
-                        logger.info(f"将新句子追加到现有句子后: '{self.english_sentence_buffer}'")
+        # 从新增文本中提取完整句子（一次切分到最后一个句子边界，剩余部分不含边界）
+        sentence, remaining_text = _split_complete_sentence(text_to_process)
+        if sentence:
+            # 检查是否已经有缓存句子，如果有则替换（实现完整句子替换碎片化翻译）
+            if self._en_parts:
+                # 只有当新句子比缓存句子更长或更完整时才替换
+                if len(sentence) > self._en_parts_length or sentence.endswith(('.', '!', '?')):
+                    if logger.isEnabledFor(logging.INFO):
+                        logger.info("用完整句子替换碎片化翻译: '%s' -> '%s'", self._english_sentence_text(), sentence)
+                    self._set_english_sentence(sentence)
                 else:
-                    # 没有缓存句子，直接设置新句子
-                    self.english_sentence_buffer = sentence
-                    logger.info(f"提取到英文句子: {sentence}")
-                
-                # 更新已处理长度（加上提取的句子长度）
-                self.english_processed_length += len(sentence)
-                remaining_text = remaining
+                    # 如果新句子不更完整，则追加到现有句子后
+                    self._append_english_sentence(sentence)
+                    if logger.isEnabledFor(logging.INFO):
+                        logger.info("将新句子追加到现有句子后: '%s'", self._english_sentence_text())
+            else:
+                # 没有缓存句子，直接设置新句子
+                self._set_english_sentence(sentence)
+                logger.info("提取到英文句子: %s", sentence)
+            
+            # 更新已处理长度（加上提取的句子长度）
+            self.english_processed_length += len(sentence)
+        
+        if remaining_text:
+            # 剩余文本中没有完整句子，检查是否有缓存句子可以追加
+            if self._en_parts and remaining_text.strip():
+                # 有缓存句子且还有剩余文本，将剩余文本追加到缓存句子后
+                self._append_english_sentence(remaining_text.strip())
+                if logger.isEnabledFor(logging.INFO):
+                    logger.info("将碎片化翻译追加到完整句子后: '%s'", self._english_sentence_text())
+                # 更新已处理长度（加上剩余文本长度）
+                self.english_processed_length += len(remaining_text)
             else:
-                # 如果没有完整句子，检查是否有缓存句子可以追加
-                if self.english_sentence_buffer and remaining_text.strip():
-                    # 有缓存句子且还有剩余文本，将剩余文本追加到缓存句子后
-                    self.english_sentence_buffer += " " + remaining_text.strip()
-                    logger.info(f"将碎片化翻译追加到完整句子后: '{self.english_sentence_buffer}'")
-                    # 更新已处理长度（加上剩余文本长度）
+                # 如果没有缓存句子，将剩余文本作为新缓存
+                if remaining_text.strip():
+                    self._set_english_sentence(remaining_text.strip())
+                    logger.info("设置新缓存句子: '%s'", self._en_parts[0])
                     self.english_processed_length += len(remaining_text)
                 else:
-                    # 如果没有缓存句子，将剩余文本作为新缓存
-                    if remaining_text.strip():
-                        self.english_sentence_buffer = remaining_text.strip()
-                        logger.info(f"设置新缓存句子: '{self.english_sentence_buffer}'")
-                        self.english_processed_length += len(remaining_text)
-                    else:
-                        # 如果没有完整句子，等待更多文本
-                        logger.info(f"未找到完整英文句子，等待更多文本: {remaining_text}")
-                break
+                    # 如果没有完整句子，等待更多文本
+                    logger.info("未找到完整英文句子，等待更多文本: %s", remaining_text)
+        
+        # 丢弃已处理的前缀，缓存只保留未处理部分
+        if self.english_processed_length:
+            self.english_text_buffer = self.english_text_buffer[self.english_processed_length:]
+            self.english_text_offset += self.english_processed_length
+            self.english_processed_length = 0
         
         # 注意：显示更新逻辑现在在update_english_text方法中统一处理
 
+    def _english_sentence_text(self):
+        """返回英文句子缓存的完整文本（片段以空格连接）"""
+        return " ".join(self._en_parts)
+
+    def _set_english_sentence(self, sentence):
+        """用一个句子替换英文句子缓存"""
+        self._en_parts = [sentence]
+        self._en_parts_length = len(sentence)
+
+    def _append_english_sentence(self, sentence):
+        """向英文句子缓存追加一个片段（连接时以空格分隔）"""
+        self._en_parts.append(sentence)
+        self._en_parts_length += 1 + len(sentence)
+
+    def _clear_english_sentence(self):
+        """清空英文句子缓存"""
+        self._en_parts = []
+        self._en_parts_length = 0
+
     def try_pair_sentences(self):
         """尝试配对中英文句子"""
-        if self.chinese_sentence_buffer and self.english_sentence_buffer:
+        if self.chinese_sentence_buffer and self._en_parts:
             # 如果中英文都有完整的句子，进行配对
             chinese_sentence = self.chinese_sentence_buffer
-            english_sentence = self.english_sentence_buffer
+            english_sentence = self._english_sentence_text()
             
-            # 添加到配对队列
-            self.paired_sentence_queue.append((chinese_sentence, english_sentence))
-            logger.info(f"配对成功: 中文='{chinese_sentence}', 英文='{english_sentence}'")
+            # 添加到配对队列（队列已满时deque会自动丢弃最旧的一对）
+            if len(self._cn_queue) == _MAX_PENDING_PAIRS:
+                logger.warning("字幕队列已满，丢弃最旧的句子对: '%s'", self._cn_queue[0])
+            self._cn_queue.append(chinese_sentence)
+            self._en_queue.append(english_sentence)
+            logger.info("配对成功: 中文='%s', 英文='%s'", chinese_sentence, english_sentence)
             
             # 清空缓存
             self.chinese_sentence_buffer = ""
-            self.english_sentence_buffer = ""
+            self._clear_english_sentence()
             
             # 保存最后的句子用于可能的单独显示
             self.last_chinese_sentence = chinese_sentence
             self.last_english_sentence = english_sentence
             
-        elif self.chinese_sentence_buffer and not self.english_sentence_buffer:
+            # 当前没有正在显示的句子时立即安排显示
+            if not self.is_showing_sentence:
+                QTimer.singleShot(0, self.update_display)
+            
+        elif self.chinese_sentence_buffer and not self._en_parts:
             # 只有中文句子，等待英文
-            logger.info(f"等待英文翻译: {self.chinese_sentence_buffer}")
+            logger.info("等待英文翻译: %s", self.chinese_sentence_buffer)
             
-        elif not self.chinese_sentence_buffer and self.english_sentence_buffer:
+        elif not self.chinese_sentence_buffer and self._en_parts:
             # 只有英文句子，等待中文
-            logger.info(f"等待中文原文: {self.english_sentence_buffer}")
+            if logger.isEnabledFor(logging.INFO):
+                logger.info("等待中文原文: %s", self._english_sentence_text())
 
     def clear_text(self):
         """清空所有文本和缓存"""
         # 清空显示内容
-        self.chinese_label.setText("")
-        self.english_label.setText("")
+        self._show_subtitle("", "")
         
         # 清空文本缓冲区
         self.chinese_text_buffer = ""
@@ -469,10 +550,11 @@ class TransparentSubtitleWindow(QMainWindow):
         
         # 清空句子缓存
         self.chinese_sentence_buffer = ""
-        self.english_sentence_buffer = ""
+        self._clear_english_sentence()
         
         # 清空句子队列
-        self.paired_sentence_queue.clear()
+        self._cn_queue.clear()
+        self._en_queue.clear()
         self.chinese_sentence_queue.clear()
         self.english_sentence_queue.clear()
         
@@ -484,9 +566,11 @@ class TransparentSubtitleWindow(QMainWindow):
         self.last_chinese_sentence = ""
         self.last_english_sentence = ""
         
-        # 重置处理长度
+        # 重置处理长度和偏移量
         self.chinese_processed_length = 0
         self.english_processed_length = 0
+        self.chinese_text_offset = 0
+        self.english_text_offset = 0
         
         # 重置显示状态
         self.is_showing_sentence = False
@@ -500,6 +584,12 @@ class TransparentSubtitleWindow(QMainWindow):
     def showEvent(self, a0):
         """窗口显示时确保置顶"""
         super().showEvent(a0)
+        # 原生窗口句柄在首次显示后才存在，此时再监听屏幕切换
+        if not self._screen_signal_connected:
+            window_handle = self.windowHandle()
+            if window_handle is not None:
+                window_handle.screenChanged.connect(self._on_screen_changed)
+                self._screen_signal_connected = True
         self.raise_()
         self.activateWindow()
     
@@ -521,7 +611,14 @@ class TransparentSubtitleWindow(QMainWindow):
     def contextMenuEvent(self, event: QContextMenuEvent):
         if event is None:
             return
-            
+        
+        # 菜单在第一次右键时创建，之后重复使用
+        if self._context_menu is None:
+            self._context_menu = self._build_context_menu()
+        self._context_menu.exec_(event.globalPos())
+    
+    def _build_context_menu(self):
+        """创建右键菜单（透明度、字体大小、关闭）"""
         menu = QMenu(self)
         menu.setStyleSheet("""
             QMenu {
@@ -541,7 +638,8 @@ class TransparentSubtitleWindow(QMainWindow):
             for opacity in [0.3, 0.5, 0.7, 0.8, 0.9, 0.95, 1.0]:
                 action = opacity_menu.addAction(f"{opacity*100:.0f}% 透明度")
                 if action is not None:
-                    action.triggered.connect(lambda checked, o=opacity: self.set_opacity(o))
+                    action.setData(opacity)
+                    action.triggered.connect(self._on_opacity_action)
         
         # 字体大小调节菜单项
         font_menu = menu.addMenu("🔤 字体大小")
@@ -549,7 +647,8 @@ class TransparentSubtitleWindow(QMainWindow):
             for size in [18, 20, 24, 28, 32, 36, 40]:
                 action = font_menu.addAction(f"{size}px")
                 if action is not None:
-                    action.triggered.connect(lambda checked, s=size: self.set_font_size(s))
+                    action.setData(size)
+                    action.triggered.connect(self._on_font_size_action)
         
         menu.addSeparator()
         
@@ -558,23 +657,54 @@ class TransparentSubtitleWindow(QMainWindow):
         if close_action is not None:
             close_action.triggered.connect(self.handle_close)
         
-        menu.exec_(event.globalPos())
+        return menu
+    
+    def _on_opacity_action(self):
+        """透明度菜单项的统一处理函数，透明度值保存在菜单项的data中"""
+        self.set_opacity(self.sender().data())
+    
+    def _on_font_size_action(self):
+        """字体大小菜单项的统一处理函数，字号保存在菜单项的data中"""
+        self.set_font_size(self.sender().data())
     
     def set_opacity(self, opacity):
         self.opacity = opacity
         self.setWindowOpacity(opacity)
     
     def set_font_size(self, size):
+        # 字号未变化时不重建字体，避免标签样式重新计算
+        if size == self.font_size:
+            return
         self.font_size = size
-        font = QFont("Microsoft YaHei")
-        font.setPointSize(size)
-        font.setBold(True)
-        self.chinese_label.setFont(font)
-        
-        english_font = QFont("Arial")
-        english_font.setPointSize(size)
-        english_font.setBold(True)
-        self.english_label.setFont(english_font)
+        self._cn_font = _make_subtitle_font(size, True)
+        self._cn_metrics = _font_metrics(size, True)
+        self._en_metrics = _font_metrics(size, False)
+        # 富文本模板：中英文各占一行，字体、字号和颜色以行内样式给出
+        self._subtitle_template = (
+            '<div style="color:#00ffff; font-family:\'Microsoft YaHei\'; '
+            'font-size:%dpt; font-weight:bold;">%%s</div>'
+            '<div style="color:#ff00ff; font-family:Arial; '
+            'font-size:%dpt; font-weight:bold; margin-top:8px;">%%s</div>'
+        ) % (size, size)
+        self.subtitle_label.setFont(self._cn_font)
+        self._render_subtitle()
+
+    def _show_subtitle(self, chinese_text, english_text):
+        """将中英文渲染为一段富文本并设置到字幕标签"""
+        if chinese_text == self._display_chinese and english_text == self._display_english:
+            return  # 内容未变化，setText也会让标签重新布局和重绘，直接跳过
+        self._display_chinese = chinese_text
+        self._display_english = english_text
+        self._render_subtitle()
+
+    def _render_subtitle(self):
+        """按当前字体模板重新生成字幕富文本"""
+        if self._display_chinese or self._display_english:
+            html_text = self._subtitle_template % (escape(self._display_chinese),
+                                                   escape(self._display_english))
+        else:
+            html_text = ""
+        self.subtitle_label.setText(html_text)
 
     def handle_close(self):
         """处理关闭操作，先通知主窗口更新按钮状态"""
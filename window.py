@@ -8,11 +8,17 @@ import logging
 import os
 import json
 import datetime
+import atexit
+import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
 from PyQt5.QtWidgets import (QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, QLabel, 
-                            QTextEdit, QPushButton, QComboBox, QSplitter, QStatusBar,
+                            QPlainTextEdit, QPushButton, QComboBox, QSplitter, QStatusBar,
                             QApplication, QMessageBox, QFileDialog, QDialog)  # 添加 QDialog 导入
-from PyQt5.QtCore import Qt, QTimer, QEvent  # 添加 QEvent 导入
-from PyQt5.QtGui import QFont, QColor
+from PyQt5.QtCore import (Qt, QTimer, QEvent, QObject, QRunnable,  # 添加 QEvent 导入
+                          QSignalBlocker, QThreadPool, pyqtSignal)
+from PyQt5.QtGui import QFont, QTextCursor, QTextOption
 
 # 导入透明字幕窗口模块
 from transparent_window import TransparentSubtitleWindow
@@ -23,6 +29,506 @@ from audio_utils import get_audio_devices, get_default_audio_device
 
 logger = logging.getLogger(__name__)
 
+# 优先使用orjson进行JSON序列化，未安装时回退到标准库json
+# 导出记录一律以紧凑格式（无缩进、无多余空格）写入；需要人工查看时可用
+# python -m json.tool --json-lines export_history.jsonl 格式化
+try:
+    import orjson
+
+    def _record_line(record):
+        """把导出记录序列化为一行JSON（UTF-8字节）"""
+        return orjson.dumps(record) + b"\n"
+except ImportError:
+    # 预先构造紧凑格式的编码器，省去每次调用json.dumps时创建编码器的开销
+    _encode_record = json.JSONEncoder(ensure_ascii=False, separators=(',', ':')).encode
+
+    def _record_line(record):
+        """把导出记录序列化为一行JSON（UTF-8字节），与orjson分支写出相同的字段"""
+        return (_encode_record(record) + "\n").encode('utf-8')
+
+# 字幕显示框最多保留的文本块（行）数，超出后自动丢弃最早的块，避免长时间运行后重新布局越来越慢
+MAX_DISPLAY_BLOCKS = 500
+
+# 字幕刷新合并间隔（毫秒）：间隔内的多次识别/翻译更新只渲染最后一次，界面刷新不超过约30帧/秒
+DISPLAY_FLUSH_INTERVAL_MS = 33
+
+# 导出文件中的时间格式
+_EXPORT_TIME_FORMAT = '%Y-%m-%d %H:%M:%S'
+_now = datetime.datetime.now
+
+# 导出记录中内容预览的最大长度
+_PREVIEW_LENGTH = 200
+
+# 导出历史保留的记录条数；追加写入的行数超过压缩阈值时才重写文件，只保留最近的记录
+_EXPORT_HISTORY_LIMIT = 50
+_EXPORT_HISTORY_COMPACT_AT = 100
+
+# 导出历史目录和文件路径（每行一条JSON记录，只追加写入）
+_EXPORT_DIR = os.path.join(os.path.dirname(__file__), "export_history")
+_RECORD_FILE = os.path.join(_EXPORT_DIR, "export_history.jsonl")
+# 旧版本的导出历史（整个文件为一个JSON数组），首次写入时导入到新文件后改名保留
+_LEGACY_RECORD_FILE = os.path.join(_EXPORT_DIR, "export_history.json")
+# 读写整个历史文件时使用的缓冲区大小：压缩阈值内的历史文件一次系统调用即可读完/写完
+_HISTORY_IO_BUFFER_SIZE = 1 << 16
+
+
+def _content_preview(parts):
+    """根据分段的导出内容生成预览，不拼接全文
+    
+    返回(前200字符, 内容是否被截断)，省略号由读取记录的一方按需显示
+    """
+    remaining = _PREVIEW_LENGTH
+    pieces = []
+    for part in parts:
+        if remaining <= 0:
+            # 预览已取满，只要后面还有内容就说明被截断
+            if part:
+                return ''.join(pieces), True
+            continue
+        pieces.append(part[:remaining])
+        remaining -= len(part)
+    return ''.join(pieces), remaining < 0
+
+
+# 界面样式表（模块级常量，只构建一次）
+_MAIN_WINDOW_QSS = """
+    QMainWindow {
+        background: qlineargradient(x1: 0, y1: 0, x2: 0, y2: 1,
+                                  stop: 0 #0a0a2a,
+                                  stop: 0.5 #1a1a3a,
+                                  stop: 1 #0a0a2a);
+        border: 2px solid #00ffff;
+        border-radius: 12px;
+    }
+"""
+
+_CENTRAL_WIDGET_QSS = """
+    QWidget {
+        background: transparent;
+    }
+"""
+
+_TITLE_LABEL_QSS = """
+    QLabel {
+        color: #00ffff;
+        background-color: rgba(0, 255, 255, 0.1);
+        padding: 12px;
+        border-radius: 8px;
+        border: 1px solid rgba(0, 255, 255, 0.3);
+    }
+"""
+
+_SPLITTER_QSS = """
+    QSplitter::handle {
+        background-color: rgba(0, 255, 255, 0.3);
+        height: 3px;
+    }
+"""
+
+_CN_PANEL_QSS = """
+    QWidget {
+        background: qlineargradient(x1: 0, y1: 0, x2: 0, y2: 1,
+                                  stop: 0 #1a1a3a,
+                                  stop: 1 #0a0a2a);
+        border-radius: 10px;
+        border: 2px solid #00ffff;
+    }
+"""
+
+_CN_LABEL_QSS = """
+    QLabel {
+        color: #00ffff;
+        background-color: rgba(0, 255, 255, 0.15);
+        padding: 8px;
+        border-radius: 6px;
+        border: 1px solid rgba(0, 255, 255, 0.3);
+    }
+"""
+
+_CN_DISPLAY_QSS = """
+    QPlainTextEdit {
+        background-color: rgba(0, 0, 0, 0.3);
+        border: 2px solid rgba(0, 255, 255, 0.2);
+        border-radius: 8px;
+        color: white;
+        padding: 20px;
+        selection-background-color: rgba(0, 255, 255, 0.3);
+    }
+"""
+
+_EN_PANEL_QSS = """
+    QWidget {
+        background: qlineargradient(x1: 0, y1: 0, x2: 0, y2: 1,
+                                  stop: 0 #1a1a3a,
+                                  stop: 1 #0a0a2a);
+        border-radius: 10px;
+        border: 2px solid #ff00ff;
+    }
+"""
+
+_EN_LABEL_QSS = """
+    QLabel {
+        color: #ff00ff;
+        background-color: rgba(255, 0, 255, 0.15);
+        padding: 8px;
+        border-radius: 6px;
+        border: 1px solid rgba(255, 0, 255, 0.3);
+    }
+"""
+
+_EN_DISPLAY_QSS = """
+    QPlainTextEdit {
+        background-color: rgba(0, 0, 0, 0.3);
+        border: 2px solid rgba(255, 0, 255, 0.2);
+        border-radius: 8px;
+        color: #DCDCF0;
+        padding: 20px;
+        selection-background-color: rgba(255, 0, 255, 0.3);
+    }
+"""
+
+_CONTROL_PANEL_QSS = """
+    QWidget {
+        background: rgba(0, 0, 0, 0.4);
+        border-radius: 10px;
+        border: 1px solid rgba(0, 255, 255, 0.2);
+        padding: 10px;
+    }
+    /* 控制按钮共用的样式，各按钮只通过objectName覆盖颜色（只在启用状态下生效，禁用时统一变灰） */
+    QPushButton {
+        color: #ffffff;
+        border-width: 2px;
+        border-style: solid;
+        border-radius: 6px;
+        padding: 10px 15px;
+        font-weight: bold;
+        font-size: 12px;
+    }
+    QPushButton:disabled {
+        background-color: rgba(100, 100, 100, 0.5);
+        color: rgba(255, 255, 255, 0.6);
+        border-color: rgba(150, 150, 150, 0.3);
+    }
+    QPushButton#refreshDevicesButton:enabled {
+        background-color: rgba(0, 100, 200, 0.7);
+        border: 2px solid rgba(0, 150, 255, 0.5);
+    }
+    QPushButton#refreshDevicesButton:enabled:hover {
+        background-color: rgba(0, 120, 220, 0.8);
+        border-color: rgba(0, 200, 255, 0.7);
+    }
+    QPushButton#refreshDevicesButton:enabled:pressed {
+        background-color: rgba(0, 80, 180, 0.9);
+        border-color: rgba(0, 255, 255, 0.8);
+    }
+    QPushButton#startButton:enabled {
+        background-color: rgba(0, 150, 0, 0.7);
+        border: 2px solid rgba(0, 200, 0, 0.5);
+    }
+    QPushButton#startButton:enabled:hover {
+        background-color: rgba(0, 180, 0, 0.8);
+        border-color: rgba(0, 255, 100, 0.7);
+    }
+    QPushButton#startButton:enabled:pressed {
+        background-color: rgba(0, 120, 0, 0.9);
+        border-color: rgba(0, 255, 150, 0.8);
+    }
+    QPushButton#stopButton:enabled {
+        background-color: rgba(180, 0, 0, 0.7);
+        border: 2px solid rgba(220, 0, 0, 0.5);
+    }
+    QPushButton#stopButton:enabled:hover {
+        background-color: rgba(200, 0, 0, 0.8);
+        border-color: rgba(255, 50, 50, 0.7);
+    }
+    QPushButton#stopButton:enabled:pressed {
+        background-color: rgba(150, 0, 0, 0.9);
+        border-color: rgba(255, 100, 100, 0.8);
+    }
+    QPushButton#clearButton:enabled {
+        background-color: rgba(200, 120, 0, 0.7);
+        border: 2px solid rgba(230, 150, 0, 0.5);
+    }
+    QPushButton#clearButton:enabled:hover {
+        background-color: rgba(220, 140, 0, 0.8);
+        border-color: rgba(255, 180, 0, 0.7);
+    }
+    QPushButton#clearButton:enabled:pressed {
+        background-color: rgba(180, 100, 0, 0.9);
+        border-color: rgba(255, 200, 0, 0.8);
+    }
+    QPushButton#toggleSubtitleButton:enabled {
+        background-color: rgba(100, 50, 180, 0.7);
+        border: 2px solid rgba(140, 80, 220, 0.5);
+    }
+    QPushButton#toggleSubtitleButton:enabled:hover {
+        background-color: rgba(120, 60, 200, 0.8);
+        border-color: rgba(180, 100, 255, 0.7);
+    }
+    QPushButton#toggleSubtitleButton:enabled:pressed {
+        background-color: rgba(80, 40, 160, 0.9);
+        border-color: rgba(200, 120, 255, 0.8);
+    }
+    QPushButton#exportButton {
+        border-radius: 8px;
+        padding: 8px 16px;
+        min-width: 80px;
+    }
+    QPushButton#exportButton:enabled {
+        background-color: rgba(0, 100, 0, 0.7);
+        color: #00ff00;
+        border: 2px solid rgba(0, 255, 0, 0.5);
+    }
+    QPushButton#exportButton:enabled:hover {
+        background-color: rgba(0, 150, 0, 0.9);
+        border: 2px solid rgba(0, 255, 0, 0.8);
+    }
+    QPushButton#exportButton:enabled:pressed {
+        background-color: rgba(0, 200, 0, 1.0);
+        border: 2px solid rgba(0, 255, 0, 1.0);
+    }
+    QPushButton#exportButton:disabled {
+        background-color: rgba(50, 50, 50, 0.5);
+        color: #888888;
+        border: 2px solid rgba(100, 100, 100, 0.3);
+    }
+"""
+
+_DEVICE_COMBO_QSS = """
+    QComboBox {
+        background-color: rgba(0, 255, 255, 0.1);
+        border: 2px solid rgba(0, 255, 255, 0.3);
+        border-radius: 6px;
+        padding: 8px;
+        color: #00ffff;
+        min-width: 250px;
+        font-weight: bold;
+    }
+    QComboBox::drop-down {
+        border: none;
+        width: 20px;
+    }
+    QComboBox QAbstractItemView {
+        background-color: #1a1a3a;
+        color: #00ffff;
+        selection-background-color: rgba(0, 255, 255, 0.3);
+        border: 1px solid rgba(0, 255, 255, 0.2);
+        outline: none;
+        max-height: 300px;  /* 限制下拉菜单最大高度 */
+        min-width: 550px;   /* 设置下拉菜单最小宽度，确保选项显示完整 */
+    }
+    QComboBox QAbstractItemView::item {
+        height: 25px;  /* 设置每个选项的高度 */
+        padding: 5px;
+    }
+    QComboBox QAbstractItemView::item:selected {
+        background-color: rgba(0, 255, 255, 0.3);
+    }
+    QScrollBar:vertical {
+        background: rgba(0, 255, 255, 0.1);
+        width: 12px;
+        margin: 0px;
+    }
+    QScrollBar::handle:vertical {
+        background: rgba(0, 255, 255, 0.5);
+        min-height: 30px;
+        border-radius: 6px;
+    }
+    QScrollBar::handle:vertical:hover {
+        background: rgba(0, 255, 255, 0.7);
+    }
+    QScrollBar::add-line:vertical, QScrollBar::sub-line:vertical {
+        background: none;
+    }
+"""
+
+_DEVICE_LABEL_QSS = """
+    QLabel {
+        color: #00ffff;
+        font-weight: bold;
+        font-size: 12px;
+        padding: 5px;
+    }
+"""
+
+_STATUS_BAR_QSS = """
+    QStatusBar {
+        background-color: rgba(0, 0, 0, 0.4);
+        color: #00ffff;
+        border-top: 2px solid rgba(0, 255, 255, 0.2);
+        font-weight: bold;
+        font-size: 12px;
+    }
+"""
+
+
+class _ExportHistoryWriter:
+    """导出历史写入器：在单线程执行器中批量追加导出记录，界面线程只负责入队"""
+    
+    def __init__(self):
+        self._executor = None  # 首次提交记录时创建
+        self._lock = threading.Lock()
+        # 等待写入的记录；历史只保留最近的记录，超出保留条数的较早记录由deque直接丢弃
+        self._pending = deque(maxlen=_EXPORT_HISTORY_LIMIT)
+        self._flush_scheduled = False  # 是否已有尚未执行的写入任务
+        self._record_lines = None  # 历史文件中的记录行数（首次写入时统计）
+    
+    def submit(self, record):
+        """提交一条导出记录，立即返回；写入任务执行前到达的记录合并为一次写入"""
+        with self._lock:
+            self._pending.append(record)
+            if self._flush_scheduled:
+                return
+            self._flush_scheduled = True
+            if self._executor is None:
+                # 单个工作线程保证写入顺序，不会出现交错的追加或压缩
+                self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="ExportHistoryWriter")
+            self._executor.submit(self._flush_pending)
+    
+    def close(self):
+        """写完剩余的记录并停止工作线程（可重复调用，之后提交的记录会启动新的工作线程）"""
+        with self._lock:
+            executor = self._executor
+            self._executor = None
+        if executor is not None:
+            executor.shutdown(wait=True)
+    
+    def _flush_pending(self):
+        with self._lock:
+            batch = self._pending
+            self._pending = deque(maxlen=_EXPORT_HISTORY_LIMIT)
+            self._flush_scheduled = False
+        self._flush(batch)
+    
+    def _flush(self, batch):
+        try:
+            record_file = _RECORD_FILE
+            new_lines = len(batch)
+            data = b"".join(map(_record_line, batch))
+            
+            # 本次运行首次写入时，先把旧版JSON历史导入到新记录之前
+            legacy_lines = self._read_legacy_history() if self._record_lines is None else None
+            if legacy_lines:
+                new_lines += len(legacy_lines)
+                data = b"".join(legacy_lines) + data
+            
+            # 追加写入，无需读取、解析和重写已有记录；
+            # 直接打开文件，只有目录不存在时才创建（不必每次先检查目录）
+            try:
+                f = open(record_file, 'ab')
+            except FileNotFoundError:
+                os.makedirs(_EXPORT_DIR, exist_ok=True)
+                f = open(record_file, 'ab')
+            with f:
+                f.write(data)
+                end_offset = f.tell()
+            
+            recent_lines = None
+            if self._record_lines is None:
+                if end_offset == len(data):
+                    # 文件原本为空（首次写入）：行数就是本次写入的行数，无需回读
+                    self._record_lines = new_lines
+                else:
+                    # 已有历史文件：流式读一遍，统计行数的同时只保留最近的记录，
+                    # 需要压缩时直接复用，不必再读一次
+                    with open(record_file, 'rb', buffering=_HISTORY_IO_BUFFER_SIZE) as f:
+                        numbered = deque(enumerate(f, 1), maxlen=_EXPORT_HISTORY_LIMIT)
+                    self._record_lines = numbered[-1][0] if numbered else 0
+                    recent_lines = [line for _, line in numbered]
+            else:
+                self._record_lines += new_lines
+            
+            if legacy_lines is not None:
+                self._retire_legacy_history()
+            
+            # 只保留最近的记录：积累到压缩阈值时才重写一次文件
+            if self._record_lines > _EXPORT_HISTORY_COMPACT_AT:
+                self._compact(record_file, recent_lines)
+            
+            logger.info("导出记录已保存: %s (%d 条)", record_file, len(batch))
+            
+        except Exception as e:
+            logger.error(f"保存导出记录时出错: {e}")
+            # 不中断主流程，记录错误即可
+    
+    def _read_legacy_history(self):
+        """读取旧版导出历史（JSON数组），转换为新格式的记录行
+        
+        没有旧文件时返回None；旧文件无法解析时记录警告并返回None，保留原文件不动
+        """
+        try:
+            with open(_LEGACY_RECORD_FILE, 'r', encoding='utf-8') as f:
+                records = json.load(f)
+            lines = []
+            for record in records[-_EXPORT_HISTORY_LIMIT:]:
+                # 旧格式的预览在截断时直接带有"..."后缀，且没有content_truncated字段
+                preview = record.get("content_preview", "")
+                truncated = len(preview) > _PREVIEW_LENGTH and preview.endswith("...")
+                lines.append(_record_line({
+                    "timestamp": record["timestamp"],
+                    "file_path": record["file_path"],
+                    "chinese_length": record["chinese_length"],
+                    "english_length": record["english_length"],
+                    "content_preview": preview[:_PREVIEW_LENGTH] if truncated else preview,
+                    "content_truncated": truncated,
+                }))
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            logger.warning("无法导入旧版导出历史 %s: %s", _LEGACY_RECORD_FILE, e)
+            return None
+        logger.info("已从旧版导出历史导入 %d 条记录", len(lines))
+        return lines
+    
+    def _retire_legacy_history(self):
+        """旧版导出历史导入完成后改名保留，避免下次启动重复导入"""
+        try:
+            os.replace(_LEGACY_RECORD_FILE, _LEGACY_RECORD_FILE + ".migrated")
+        except OSError as e:
+            logger.warning("旧版导出历史改名失败 %s: %s", _LEGACY_RECORD_FILE, e)
+    
+    def _compact(self, record_file, recent_lines=None):
+        """重写导出历史文件，只保留最近的记录（recent_lines为已读取的最近记录行）"""
+        if recent_lines is None:
+            with open(record_file, 'rb', buffering=_HISTORY_IO_BUFFER_SIZE) as f:
+                recent_lines = deque(f, maxlen=_EXPORT_HISTORY_LIMIT)
+        # 先写临时文件再原子替换，进程中途退出也不会留下写了一半的历史文件
+        temp_file = record_file + ".tmp"
+        with open(temp_file, 'wb', buffering=_HISTORY_IO_BUFFER_SIZE) as f:
+            f.writelines(recent_lines)
+        os.replace(temp_file, record_file)
+        self._record_lines = len(recent_lines)
+        logger.info("导出历史已压缩，保留最近 %d 条记录", len(recent_lines))
+
+
+_export_history_writer = _ExportHistoryWriter()
+# 程序退出前写完尚未落盘的导出记录
+atexit.register(_export_history_writer.close)
+
+
+class _DeviceScanSignals(QObject):
+    """设备扫描任务的信号（QRunnable不是QObject，不能直接定义信号）"""
+    devices_ready = pyqtSignal(list, object)  # (设备列表, 推荐的默认设备或None)
+    scan_failed = pyqtSignal(str)
+
+
+class _EnumerateDevicesTask(QRunnable):
+    """在线程池中枚举音频设备，避免PortAudio/WASAPI设备探测阻塞界面线程"""
+    
+    def __init__(self, preferred_type):
+        super().__init__()
+        self.preferred_type = preferred_type
+        self.signals = _DeviceScanSignals()
+    
+    def run(self):
+        try:
+            devices = get_audio_devices()
+            default_device = get_default_audio_device(self.preferred_type)
+        except Exception as e:
+            self.signals.scan_failed.emit(str(e))
+            return
+        self.signals.devices_ready.emit(devices, default_device)
+
 
 # 主窗口类
 class SubtitleDisplay(QMainWindow):
@@ -37,25 +543,32 @@ class SubtitleDisplay(QMainWindow):
         self.worker = None
         self.chinese_text = ""
         self.english_text = ""
+        self.english_incremental = False  # 最近一次英文更新是否为增量（在线）翻译
         self.audio_devices = []
+        self._device_scan_task = None  # 正在进行的设备扫描任务
         self.subtitle_window = None  # 透明字幕窗口
+        # 透明字幕窗口的更新方法（窗口存在时缓存绑定方法，刷新时直接调用）
+        self._sw_update_cn = None
+        self._sw_update_en = None
         self.show_subtitle_window = True  # 默认打开透明字幕窗口
         self.is_clearing = False  # 清空状态标志
         self.clearing_timer = QTimer()  # 清空状态定时器
         self.clearing_timer.setSingleShot(True)
         self.clearing_timer.timeout.connect(self._reset_clearing_state)
+        
+        # 待刷新的字幕文本（None表示没有待刷新内容），由刷新定时器统一渲染
+        self._pending_cn = None
+        self._pending_en = None               # 待刷新的完整（离线）英文
+        self._pending_en_incremental = None   # 待刷新的增量（在线）英文
+        self._flush_timer = QTimer()
+        self._flush_timer.setSingleShot(True)
+        self._flush_timer.setInterval(DISPLAY_FLUSH_INTERVAL_MS)
+        self._flush_timer.timeout.connect(self._flush_pending_text)
+        self._cn_shown = ""  # 中文显示框中已渲染的文本
+        self._en_shown = ""  # 英文显示框中已渲染的文本
 
         # 设置科技感窗口样式
-        self.setStyleSheet("""
-            QMainWindow {
-                background: qlineargradient(x1: 0, y1: 0, x2: 0, y2: 1,
-                                          stop: 0 #0a0a2a,
-                                          stop: 0.5 #1a1a3a,
-                                          stop: 1 #0a0a2a);
-                border: 2px solid #00ffff;
-                border-radius: 12px;
-            }
-        """)
+        self.setStyleSheet(_MAIN_WINDOW_QSS)
         
         # 窗口居中显示
         screen = QApplication.primaryScreen()
@@ -68,11 +581,7 @@ class SubtitleDisplay(QMainWindow):
 
         # 创建UI
         central_widget = QWidget()
-        central_widget.setStyleSheet("""
-            QWidget {
-                background: transparent;
-            }
-        """)
+        central_widget.setStyleSheet(_CENTRAL_WIDGET_QSS)
         self.setCentralWidget(central_widget)
         layout = QVBoxLayout(central_widget)
         layout.setSpacing(15)
@@ -82,68 +591,31 @@ class SubtitleDisplay(QMainWindow):
         title_label = QLabel("🚀 智能语音识别翻译系统")
         title_label.setFont(QFont("Microsoft YaHei", 18, QFont.Bold))
         title_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        title_label.setStyleSheet("""
-            QLabel {
-                color: #00ffff;
-                background-color: rgba(0, 255, 255, 0.1);
-                padding: 12px;
-                border-radius: 8px;
-                border: 1px solid rgba(0, 255, 255, 0.3);
-            }
-        """)
+        title_label.setStyleSheet(_TITLE_LABEL_QSS)
         layout.addWidget(title_label)
 
         # 字幕显示区域
         splitter = QSplitter(Qt.Orientation.Vertical)
-        splitter.setStyleSheet("""
-            QSplitter::handle {
-                background-color: rgba(0, 255, 255, 0.3);
-                height: 3px;
-            }
-        """)
+        splitter.setStyleSheet(_SPLITTER_QSS)
 
         # 中文显示 - 科技感设计
         chinese_widget = QWidget()
-        chinese_widget.setStyleSheet("""
-            QWidget {
-                background: qlineargradient(x1: 0, y1: 0, x2: 0, y2: 1,
-                                          stop: 0 #1a1a3a,
-                                          stop: 1 #0a0a2a);
-                border-radius: 10px;
-                border: 2px solid #00ffff;
-            }
-        """)
+        chinese_widget.setStyleSheet(_CN_PANEL_QSS)
         chinese_layout = QVBoxLayout(chinese_widget)
         chinese_layout.setContentsMargins(10, 10, 10, 10)
         
         chinese_label = QLabel("🔤 语音识别")
         chinese_label.setFont(QFont("Microsoft YaHei", 14, QFont.Bold))
         chinese_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        chinese_label.setStyleSheet("""
-            QLabel {
-                color: #00ffff;
-                background-color: rgba(0, 255, 255, 0.15);
-                padding: 8px;
-                border-radius: 6px;
-                border: 1px solid rgba(0, 255, 255, 0.3);
-            }
-        """)
-
-        self.chinese_display = QTextEdit()
+        chinese_label.setStyleSheet(_CN_LABEL_QSS)
+
+        # 使用纯文本编辑框：纯文本布局引擎，无需解析HTML，行度量开销远小于QTextEdit
+        self.chinese_display = QPlainTextEdit()
         self.chinese_display.setReadOnly(True)
-        self.chinese_display.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        self.chinese_display.setMaximumBlockCount(MAX_DISPLAY_BLOCKS)
+        self.chinese_display.document().setDefaultTextOption(QTextOption(Qt.AlignmentFlag.AlignCenter))
         self.chinese_display.setFont(QFont("Microsoft YaHei", 20, QFont.Bold))
-        self.chinese_display.setTextColor(QColor(255, 255, 255))
-        self.chinese_display.setStyleSheet("""
-            QTextEdit {
-                background-color: rgba(0, 0, 0, 0.3);
-                border: 2px solid rgba(0, 255, 255, 0.2);
-                border-radius: 8px;
-                color: white;
-                padding: 20px;
-                selection-background-color: rgba(0, 255, 255, 0.3);
-            }
-        """)
+        self.chinese_display.setStyleSheet(_CN_DISPLAY_QSS)
         self.chinese_display.setMinimumHeight(220)
 
         chinese_layout.addWidget(chinese_label)
@@ -151,47 +623,26 @@ class SubtitleDisplay(QMainWindow):
 
         # 英文显示 - 科技感设计
         english_widget = QWidget()
-        english_widget.setStyleSheet("""
-            QWidget {
-                background: qlineargradient(x1: 0, y1: 0, x2: 0, y2: 1,
-                                          stop: 0 #1a1a3a,
-                                          stop: 1 #0a0a2a);
-                border-radius: 10px;
-                border: 2px solid #ff00ff;
-            }
-        """)
+        english_widget.setStyleSheet(_EN_PANEL_QSS)
         english_layout = QVBoxLayout(english_widget)
         english_layout.setContentsMargins(10, 10, 10, 10)
         
         english_label = QLabel("🌐 文本翻译")
         english_label.setFont(QFont("Microsoft YaHei", 14, QFont.Bold))
         english_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        english_label.setStyleSheet("""
-            QLabel {
-                color: #ff00ff;
-                background-color: rgba(255, 0, 255, 0.15);
-                padding: 8px;
-                border-radius: 6px;
-                border: 1px solid rgba(255, 0, 255, 0.3);
-            }
-        """)
-
-        self.english_display = QTextEdit()
+        english_label.setStyleSheet(_EN_LABEL_QSS)
+
+        self.english_display = QPlainTextEdit()
         self.english_display.setReadOnly(True)
-        self.english_display.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        self.english_display.setMaximumBlockCount(MAX_DISPLAY_BLOCKS)
+        self.english_display.document().setDefaultTextOption(QTextOption(Qt.AlignmentFlag.AlignCenter))
         self.english_display.setFont(QFont("Arial", 18, QFont.Bold))
-        self.english_display.setTextColor(QColor(220, 220, 255))
-        self.english_display.setStyleSheet("""
-            QTextEdit {
-                background-color: rgba(0, 0, 0, 0.3);
-                border: 2px solid rgba(255, 0, 255, 0.2);
-                border-radius: 8px;
-                color: #DCDCF0;
-                padding: 20px;
-                selection-background-color: rgba(255, 0, 255, 0.3);
-            }
-        """)
+        self.english_display.setStyleSheet(_EN_DISPLAY_QSS)
         self.english_display.setMinimumHeight(180)
+        
+        # 缓存刷新时使用的文档光标，避免每次刷新都重新获取Qt对象的Python包装
+        self._cn_cursor = QTextCursor(self.chinese_display.document())
+        self._en_cursor = QTextCursor(self.english_display.document())
 
         english_layout.addWidget(english_label)
         english_layout.addWidget(self.english_display)
@@ -202,212 +653,38 @@ class SubtitleDisplay(QMainWindow):
 
         # 控制按钮和音频源选择
         control_widget = QWidget()
-        control_widget.setStyleSheet("""
-            QWidget {
-                background: rgba(0, 0, 0, 0.4);
-                border-radius: 10px;
-                border: 1px solid rgba(0, 255, 255, 0.2);
-                padding: 10px;
-            }
-        """)
+        # 控制面板及其中所有按钮的样式集中在一个样式表中，只解析一次
+        control_widget.setStyleSheet(_CONTROL_PANEL_QSS)
         control_layout = QHBoxLayout(control_widget)
         control_layout.setSpacing(10)
 
         # 音频设备选择
         self.device_combo = QComboBox()
-        self.device_combo.setStyleSheet("""
-            QComboBox {
-                background-color: rgba(0, 255, 255, 0.1);
-                border: 2px solid rgba(0, 255, 255, 0.3);
-                border-radius: 6px;
-                padding: 8px;
-                color: #00ffff;
-                min-width: 250px;
-                font-weight: bold;
-            }
-            QComboBox::drop-down {
-                border: none;
-                width: 20px;
-            }
-            QComboBox QAbstractItemView {
-                background-color: #1a1a3a;
-                color: #00ffff;
-                selection-background-color: rgba(0, 255, 255, 0.3);
-                border: 1px solid rgba(0, 255, 255, 0.2);
-                outline: none;
-                max-height: 300px;  /* 限制下拉菜单最大高度 */
-                min-width: 550px;   /* 设置下拉菜单最小宽度，确保选项显示完整 */
-            }
-            QComboBox QAbstractItemView::item {
-                height: 25px;  /* 设置每个选项的高度 */
-                padding: 5px;
-            }
-            QComboBox QAbstractItemView::item:selected {
-                background-color: rgba(0, 255, 255, 0.3);
-            }
-            QScrollBar:vertical {
-                background: rgba(0, 255, 255, 0.1);
-                width: 12px;
-                margin: 0px;
-            }
-            QScrollBar::handle:vertical {
-                background: rgba(0, 255, 255, 0.5);
-                min-height: 30px;
-                border-radius: 6px;
-            }
-            QScrollBar::handle:vertical:hover {
-                background: rgba(0, 255, 255, 0.7);
-            }
-            QScrollBar::add-line:vertical, QScrollBar::sub-line:vertical {
-                background: none;
-            }
-        """)
+        self.device_combo.setStyleSheet(_DEVICE_COMBO_QSS)
         self.refresh_devices_button = QPushButton("刷新设备")
-        self.refresh_devices_button.setStyleSheet("""
-            QPushButton {
-                background-color: rgba(0, 100, 200, 0.7);
-                color: #ffffff;
-                border: 2px solid rgba(0, 150, 255, 0.5);
-                border-radius: 6px;
-                padding: 10px 15px;
-                font-weight: bold;
-                font-size: 12px;
-            }
-            QPushButton:hover {
-                background-color: rgba(0, 120, 220, 0.8);
-                border-color: rgba(0, 200, 255, 0.7);
-            }
-            QPushButton:pressed {
-                background-color: rgba(0, 80, 180, 0.9);
-                border-color: rgba(0, 255, 255, 0.8);
-            }
-            QPushButton:disabled {
-                background-color: rgba(100, 100, 100, 0.5);
-                color: rgba(255, 255, 255, 0.6);
-                border-color: rgba(150, 150, 150, 0.3);
-            }
-        """)
+        self.refresh_devices_button.setObjectName("refreshDevicesButton")
         self.refresh_devices_button.clicked.connect(self.refresh_audio_devices)
 
         self.start_button = QPushButton("开始识别")
-        self.start_button.setStyleSheet("""
-            QPushButton {
-                background-color: rgba(0, 150, 0, 0.7);
-                color: #ffffff;
-                border: 2px solid rgba(0, 200, 0, 0.5);
-                border-radius: 6px;
-                padding: 10px 15px;
-                font-weight: bold;
-                font-size: 12px;
-            }
-            QPushButton:hover {
-                background-color: rgba(0, 180, 0, 0.8);
-                border-color: rgba(0, 255, 100, 0.7);
-            }
-            QPushButton:pressed {
-                background-color: rgba(0, 120, 0, 0.9);
-                border-color: rgba(0, 255, 150, 0.8);
-            }
-            QPushButton:disabled {
-                background-color: rgba(100, 100, 100, 0.5);
-                color: rgba(255, 255, 255, 0.6);
-                border-color: rgba(150, 150, 150, 0.3);
-            }
-        """)
+        self.start_button.setObjectName("startButton")
         self.start_button.clicked.connect(self.start_recognition)
 
         self.stop_button = QPushButton("停止识别")
-        self.stop_button.setStyleSheet("""
-            QPushButton {
-                background-color: rgba(180, 0, 0, 0.7);
-                color: #ffffff;
-                border: 2px solid rgba(220, 0, 0, 0.5);
-                border-radius: 6px;
-                padding: 10px 15px;
-                font-weight: bold;
-                font-size: 12px;
-            }
-            QPushButton:hover {
-                background-color: rgba(200, 0, 0, 0.8);
-                border-color: rgba(255, 50, 50, 0.7);
-            }
-            QPushButton:pressed {
-                background-color: rgba(150, 0, 0, 0.9);
-                border-color: rgba(255, 100, 100, 0.8);
-            }
-            QPushButton:disabled {
-                background-color: rgba(100, 100, 100, 0.5);
-                color: rgba(255, 255, 255, 0.6);
-                border-color: rgba(150, 150, 150, 0.3);
-            }
-        """)
+        self.stop_button.setObjectName("stopButton")
         self.stop_button.clicked.connect(self.stop_recognition)
         self.stop_button.setEnabled(False)
 
         self.clear_button = QPushButton("清空字幕")
-        self.clear_button.setStyleSheet("""
-            QPushButton {
-                background-color: rgba(200, 120, 0, 0.7);
-                color: #ffffff;
-                border: 2px solid rgba(230, 150, 0, 0.5);
-                border-radius: 6px;
-                padding: 10px 15px;
-                font-weight: bold;
-                font-size: 12px;
-            }
-            QPushButton:hover {
-                background-color: rgba(220, 140, 0, 0.8);
-                border-color: rgba(255, 180, 0, 0.7);
-            }
-            QPushButton:pressed {
-                background-color: rgba(180, 100, 0, 0.9);
-                border-color: rgba(255, 200, 0, 0.8);
-            }
-            QPushButton:disabled {
-                background-color: rgba(100, 100, 100, 0.5);
-                color: rgba(255, 255, 255, 0.6);
-                border-color: rgba(150, 150, 150, 0.3);
-            }
-        """)
+        self.clear_button.setObjectName("clearButton")
         self.clear_button.clicked.connect(self.clear_subtitles)
 
         # 添加透明字幕窗口控制按钮
         self.toggle_subtitle_button = QPushButton("隐藏透明字幕")  # 默认显示，所以按钮文字为隐藏
-        self.toggle_subtitle_button.setStyleSheet("""
-            QPushButton {
-                background-color: rgba(100, 50, 180, 0.7);
-                color: #ffffff;
-                border: 2px solid rgba(140, 80, 220, 0.5);
-                border-radius: 6px;
-                padding: 10px 15px;
-                font-weight: bold;
-                font-size: 12px;
-            }
-            QPushButton:hover {
-                background-color: rgba(120, 60, 200, 0.8);
-                border-color: rgba(180, 100, 255, 0.7);
-            }
-            QPushButton:pressed {
-                background-color: rgba(80, 40, 160, 0.9);
-                border-color: rgba(200, 120, 255, 0.8);
-            }
-            QPushButton:disabled {
-                background-color: rgba(100, 100, 100, 0.5);
-                color: rgba(255, 255, 255, 0.6);
-                border-color: rgba(150, 150, 150, 0.3);
-            }
-        """)
+        self.toggle_subtitle_button.setObjectName("toggleSubtitleButton")
         self.toggle_subtitle_button.clicked.connect(self.toggle_subtitle_window)
 
         input_device_label = QLabel("输入设备:")
-        input_device_label.setStyleSheet("""
-            QLabel {
-                color: #00ffff;
-                font-weight: bold;
-                font-size: 12px;
-                padding: 5px;
-            }
-        """)
+        input_device_label.setStyleSheet(_DEVICE_LABEL_QSS)
         control_layout.addWidget(input_device_label)
         control_layout.addWidget(self.device_combo)
         control_layout.addWidget(self.refresh_devices_button)
@@ -418,31 +695,7 @@ class SubtitleDisplay(QMainWindow):
 
         # 添加导出按钮
         self.export_button = QPushButton("导出字幕")
-        self.export_button.setStyleSheet("""
-            QPushButton {
-                background-color: rgba(0, 100, 0, 0.7);
-                color: #00ff00;
-                border: 2px solid rgba(0, 255, 0, 0.5);
-                border-radius: 8px;
-                padding: 8px 16px;
-                font-weight: bold;
-                font-size: 12px;
-                min-width: 80px;
-            }
-            QPushButton:hover {
-                background-color: rgba(0, 150, 0, 0.9);
-                border: 2px solid rgba(0, 255, 0, 0.8);
-            }
-            QPushButton:pressed {
-                background-color: rgba(0, 200, 0, 1.0);
-                border: 2px solid rgba(0, 255, 0, 1.0);
-            }
-            QPushButton:disabled {
-                background-color: rgba(50, 50, 50, 0.5);
-                color: #888888;
-                border: 2px solid rgba(100, 100, 100, 0.3);
-            }
-        """)
+        self.export_button.setObjectName("exportButton")
         self.export_button.clicked.connect(self.export_subtitles)
         control_layout.addWidget(self.export_button)
 
@@ -454,15 +707,7 @@ class SubtitleDisplay(QMainWindow):
 
         # 状态栏
         self.status_bar = QStatusBar()
-        self.status_bar.setStyleSheet("""
-            QStatusBar {
-                background-color: rgba(0, 0, 0, 0.4);
-                color: #00ffff;
-                border-top: 2px solid rgba(0, 255, 255, 0.2);
-                font-weight: bold;
-                font-size: 12px;
-            }
-        """)
+        self.status_bar.setStyleSheet(_STATUS_BAR_QSS)
         self.setStatusBar(self.status_bar)
         self.status_bar.showMessage("系统就绪 - 等待指令")
 
@@ -473,36 +718,78 @@ class SubtitleDisplay(QMainWindow):
         self.toggle_subtitle_window()
 
     def refresh_audio_devices(self):
-        """刷新音频设备列表，只显示真正可用的设备"""
+        """在后台线程中刷新音频设备列表，扫描完成后在界面线程中填充设备列表"""
+        if self._device_scan_task is not None:
+            return  # 已有扫描在进行
+        
+        # 扫描期间禁止刷新和开始识别
+        self.refresh_devices_button.setEnabled(False)
+        self.start_button.setEnabled(False)
+        status_bar = self.statusBar()
+        if status_bar:
+            status_bar.showMessage("正在扫描音频设备…")
+        
+        # 根据当前音频源类型选择默认设备
+        preferred_type = "system_audio" if self.args.audio_source == "system_audio" else "microphone"
+        task = _EnumerateDevicesTask(preferred_type)
+        task.signals.devices_ready.connect(self._on_devices_ready)
+        task.signals.scan_failed.connect(self._on_device_scan_failed)
+        # 保持引用直到扫描结束，信号对象随任务一起存活
+        self._device_scan_task = task
+        QThreadPool.globalInstance().start(task)
+
+    def _finish_device_scan(self):
+        """扫描结束后恢复按钮状态"""
+        self._device_scan_task = None
+        self.refresh_devices_button.setEnabled(self.worker is None)
+        self.start_button.setEnabled(self.worker is None)
+
+    def _on_device_scan_failed(self, error_message):
+        """设备扫描失败（界面线程）"""
+        self._finish_device_scan()
+        logger.error("刷新音频设备列表时出错: %s", error_message)
+        status_bar = self.statusBar()
+        if status_bar:
+            status_bar.showMessage(f"设备扫描失败: {error_message}")
+
+    def _on_devices_ready(self, devices, default_device):
+        """设备扫描完成（界面线程），只显示真正可用的设备"""
+        self._finish_device_scan()
         try:
-            # 获取真正可用的音频设备
-            self.audio_devices = get_audio_devices()
+            self.audio_devices = devices
 
-            self.device_combo.clear()
+            # 只添加可用的设备（在设备名称中显示设备类型）
+            usable_devices = [device for device in self.audio_devices if device[3]]
+            display_names = [f"{index}: {name} [{device_type}]"
+                             for index, name, device_type, _ in usable_devices]
+            available_count = len(usable_devices)
+            
+            # 查找最合适的默认设备所在的行
+            default_row = -1
+            if default_device:
+                for row, device in enumerate(usable_devices):
+                    if device[0] == default_device[0]:
+                        default_row = row
+                        break
             
-            # 只添加可用的设备
-            available_count = 0
-            for index, name, device_type, is_usable in self.audio_devices:
-                if is_usable:
-                    # 在设备名称中显示设备类型
-                    display_name = f"{index}: {name} [{device_type}]"
-                    self.device_combo.addItem(display_name, index)
-                    available_count += 1
-
-            # 选择最合适的默认设备
+            # 一次性插入所有选项，避免逐项插入时下拉视图反复重新计算几何尺寸；
+            # 重新填充期间屏蔽信号，清空、插入和选中默认设备不会逐项发出选中变化通知
+            self.device_combo.setUpdatesEnabled(False)
+            try:
+                with QSignalBlocker(self.device_combo):
+                    self.device_combo.clear()
+                    self.device_combo.addItems(display_names)
+                    for row, device in enumerate(usable_devices):
+                        self.device_combo.setItemData(row, device[0])
+                    if default_row >= 0:
+                        self.device_combo.setCurrentIndex(default_row)
+            finally:
+                self.device_combo.setUpdatesEnabled(True)
+
             if available_count > 0:
-                # 根据当前音频源类型选择默认设备
-                preferred_type = "system_audio" if self.args.audio_source == "system_audio" else "microphone"
-                default_device = get_default_audio_device(preferred_type)
-                
-                if default_device:
+                if default_row >= 0:
                     device_index, device_name, device_type, is_usable = default_device
-                    # 查找并选择默认设备
-                    for i in range(self.device_combo.count()):
-                        if self.device_combo.itemData(i) == device_index:
-                            self.device_combo.setCurrentIndex(i)
-                            logger.info(f"已选择默认设备: {device_name} [{device_type}]")
-                            break
+                    logger.info(f"已选择默认设备: {device_name} [{device_type}]")
                 
                 status_bar = self.statusBar()
                 if status_bar:
@@ -555,10 +842,8 @@ class SubtitleDisplay(QMainWindow):
                     logger.warning("工作线程已停止或未运行，跳过停止操作")
                     self.on_worker_finished()
             except Exception as e:
-                logger.error(f"停止识别时发生错误: {e}")
-                logger.error(f"错误类型: {type(e).__name__}")
-                import traceback
-                logger.error(f"堆栈跟踪: {traceback.format_exc()}")
+                # logger.exception附带堆栈信息，由日志处理器按需格式化
+                logger.exception("停止识别时发生错误(%s): %s", type(e).__name__, e)
                 # 确保UI状态恢复正常
                 self.on_worker_finished()
         
@@ -573,10 +858,7 @@ class SubtitleDisplay(QMainWindow):
                 self.streaming_timer.stop()
                 
         except Exception as e:
-            logger.error(f"清空流式状态时发生错误: {e}")
-            logger.error(f"错误类型: {type(e).__name__}")
-            import traceback
-            logger.error(f"堆栈跟踪: {traceback.format_exc()}")
+            logger.exception("清空流式状态时发生错误(%s): %s", type(e).__name__, e)
             self.status_bar.showMessage(f"清空状态失败: {e}")
         
         # 更新状态栏消息，提示用户字幕内容已保留
@@ -585,56 +867,110 @@ class SubtitleDisplay(QMainWindow):
     def update_chinese_text(self, text):
         # 如果正在清空状态，忽略工作线程的更新
         if self.is_clearing:
-            logger.info("清空状态中，忽略中文更新: %s", text)
+            logger.debug("清空状态中，忽略中文更新")
             return
-            
-        logger.info("主字幕窗口更新中文显示: %s", text)
-        self.chinese_text = text
-        self.chinese_display.setText(text)
         
-        # 滚动条自动滚动到底部
-        scroll_bar = self.chinese_display.verticalScrollBar()
-        if scroll_bar:
-            scroll_bar.setValue(scroll_bar.maximum())
-
-        # 同时更新透明字幕窗口
-        if hasattr(self, 'subtitle_window') and self.subtitle_window:
-            self.subtitle_window.update_chinese_text(text)
+        # 识别结果在修正之间经常重复发送相同文本，内容未变化时无需重新渲染和转发
+        if text == self.chinese_text:
+            return
+        
+        # 每次识别结果都会触发，只在DEBUG级别下格式化（可能很长的）累计文本
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("主字幕窗口更新中文显示: %s", text)
+        self.chinese_text = text
+        # 只记录最新文本，由刷新定时器合并渲染
+        self._pending_cn = text
+        if not self._flush_timer.isActive():
+            self._flush_timer.start()
 
     def update_english_text(self, text, is_incremental=False):
         """更新英文显示，支持在线/离线通道模式（仿照中文更新策略）"""
-        logger.info("窗口更新英文显示: %s (在线模式: %s)", text, is_incremental)
-        
         # 如果正在清空状态，忽略工作线程的更新
         if self.is_clearing:
-            logger.info("清空状态中，忽略英文更新: %s", text)
+            logger.debug("清空状态中，忽略英文更新")
             return
         
+        # 文本和通道都未变化时跳过（完整翻译即使与增量内容相同也要交给字幕窗口提取句子）
+        if text == self.english_text and is_incremental == self.english_incremental:
+            return
+        
+        # 每次翻译结果都会触发，只在DEBUG级别下格式化累计文本
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("窗口更新英文显示: %s (在线模式: %s)", text, is_incremental)
+        
+        # 在线模式（类似2pass-online）和离线模式（类似2pass-offline）都直接替换显示内容
+        self.english_text = text
+        self.english_incremental = is_incremental
+        
+        # 只记录最新文本，由刷新定时器合并渲染
         if is_incremental:
-            # 在线模式：直接替换显示内容（类似2pass-online）
-            self.english_text = text
-            logger.info("在线模式更新英文显示: %s", text)
+            self._pending_en_incremental = text
         else:
-            # 离线模式：直接替换显示内容（类似2pass-offline）
-            self.english_text = text
-            logger.info("离线模式更新英文显示: %s", text)
+            # 完整翻译取代之前尚未渲染的增量翻译
+            self._pending_en = text
+            self._pending_en_incremental = None
+        if not self._flush_timer.isActive():
+            self._flush_timer.start()
+
+    def _flush_pending_text(self):
+        """将刷新间隔内累积的最新字幕文本一次性渲染到主窗口和透明字幕窗口"""
+        if self._pending_cn is not None:
+            text = self._pending_cn
+            self._pending_cn = None
+            self._cn_shown = self._render_display(self.chinese_display, self._cn_cursor,
+                                                  text, self._cn_shown)
+            
+            # 同时更新透明字幕窗口
+            if self._sw_update_cn is not None:
+                self._sw_update_cn(text)
         
-        # 更新显示
-        self.english_display.setText(self.english_text)
+        if self._pending_en is not None or self._pending_en_incremental is not None:
+            full_text = self._pending_en
+            incremental_text = self._pending_en_incremental
+            self._pending_en = None
+            self._pending_en_incremental = None
+            
+            # 更新显示
+            self._en_shown = self._render_display(self.english_display, self._en_cursor,
+                                                  self.english_text, self._en_shown)
+            
+            # 同时更新透明字幕窗口：先处理完整翻译（句子提取），再显示其后到达的增量翻译
+            if self._sw_update_en is not None:
+                if full_text is not None:
+                    self._sw_update_en(full_text, False)
+                if incremental_text is not None:
+                    self._sw_update_en(incremental_text, True)
+
+    def _render_display(self, display, cursor, text, shown_text):
+        """渲染文本到显示框并滚动到底部，返回渲染后显示框中的文本
         
-        # 滚动条自动滚动到底部
-        scroll_bar = self.english_display.verticalScrollBar()
-        if scroll_bar:
-            scroll_bar.setValue(scroll_bar.maximum())
+        新文本只是在已显示内容后追加时只插入新增部分，只需重新布局最后一个文本块；
+        否则回退为整体替换
+        """
+        if text == shown_text:
+            return shown_text
+        if shown_text and text.startswith(shown_text):
+            cursor.movePosition(QTextCursor.MoveOperation.End)
+            cursor.insertText(text[len(shown_text):])
+        else:
+            display.setPlainText(text)
         
-        # 同时更新透明字幕窗口
-        if hasattr(self, 'subtitle_window') and self.subtitle_window:
-            self.subtitle_window.update_english_text(self.english_text, is_incremental)
+        # 将光标移到末尾，显示框会自动滚动到新内容处
+        display.moveCursor(QTextCursor.MoveOperation.End)
+        return text
+
+    def _discard_pending_text(self):
+        """丢弃尚未渲染的字幕更新"""
+        self._flush_timer.stop()
+        self._pending_cn = None
+        self._pending_en = None
+        self._pending_en_incremental = None
     
 
 
     def update_status(self, message):
-        logger.info("状态更新: %s", message)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("状态更新: %s", message)
         self.status_bar.showMessage(message)
     
     def on_worker_finished(self):
@@ -660,14 +996,18 @@ class SubtitleDisplay(QMainWindow):
         # 设置清空状态，防止工作线程更新覆盖
         self.is_clearing = True
         
-        # 清空主窗口显示
+        # 清空主窗口显示（同时丢弃尚未渲染的更新，避免清空后又被刷新出来）
+        self._discard_pending_text()
         self.chinese_text = ""
         self.english_text = ""
-        self.chinese_display.setText("")
-        self.english_display.setText("")
+        self.english_incremental = False
+        self.chinese_display.clear()
+        self.english_display.clear()
+        self._cn_shown = ""
+        self._en_shown = ""
         
         # 清空透明字幕窗口
-        if hasattr(self, 'subtitle_window') and self.subtitle_window:
+        if self.subtitle_window:
             self.subtitle_window.clear_text()
         
         # 清空工作线程中的英文在线/离线通道
@@ -697,7 +1037,7 @@ class SubtitleDisplay(QMainWindow):
             self.stop_recognition()
             
             # 延迟500毫秒后重新开始识别
-            QTimer.singleShot(500, lambda: self._resume_recognition(current_device_index))
+            QTimer.singleShot(500, partial(self._resume_recognition, current_device_index))
             
         except Exception as e:
             logger.error("重新开始识别会话时发生错误: %s", str(e))
@@ -749,20 +1089,22 @@ class SubtitleDisplay(QMainWindow):
         
     def closeEvent(self, a0):
         """当主窗口关闭时，确保透明字幕窗口也被关闭"""
-        if hasattr(self, 'subtitle_window') and self.subtitle_window:
+        if self.subtitle_window:
             self.subtitle_window.close()
+        # 写完尚未落盘的导出记录
+        _export_history_writer.close()
         if a0:
             a0.accept()
 
     def toggle_subtitle_window(self):
         """切换透明字幕窗口的显示/隐藏"""
-        if not hasattr(self, 'subtitle_window') or not self.subtitle_window:
+        if not self.subtitle_window:
             # 创建透明字幕窗口 - 传入回调函数用于联动
             self.subtitle_window = TransparentSubtitleWindow(on_close_callback=self.on_subtitle_window_closed)
+            self._sw_update_cn = self.subtitle_window.update_chinese_text
+            self._sw_update_en = self.subtitle_window.update_english_text
             self.subtitle_window.show()
             self.toggle_subtitle_button.setText("隐藏透明字幕")
-            if not hasattr(self, 'show_subtitle_window'):
-                self.show_subtitle_window = True
         else:
             # 检查窗口是否实际可见，而不是仅仅检查状态变量
             if self.subtitle_window.isVisible():
@@ -781,6 +1123,8 @@ class SubtitleDisplay(QMainWindow):
         self.show_subtitle_window = False
         # 清空副窗口引用，确保下次点击按钮会重新创建
         self.subtitle_window = None
+        self._sw_update_cn = None
+        self._sw_update_en = None
 
 
     def export_subtitles(self):
@@ -803,17 +1147,27 @@ class SubtitleDisplay(QMainWindow):
             if not file_path.lower().endswith('.txt'):
                 file_path += '.txt'
             
-            # 格式化导出内容
-            export_content = f"中文识别内容:\n{self.chinese_text}\n\n" \
-                           f"英文翻译内容:\n{self.english_text}\n\n" \
-                           f"导出时间: {datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n"
+            # 保存对话框期间字幕仍可能更新，此处取一次快照，
+            # 导出内容和导出记录中的长度都基于同一份文本
+            chinese_text = self.chinese_text
+            english_text = self.english_text
+            
+            # 导出内容分段写入，不把（可能很长的）中英文全文再拼接成一个新字符串
+            export_parts = (
+                "中文识别内容:\n", chinese_text,
+                "\n\n英文翻译内容:\n", english_text,
+                f"\n\n导出时间: {_now().strftime(_EXPORT_TIME_FORMAT)}\n",
+            )
             
             # 写入文件
             with open(file_path, 'w', encoding='utf-8') as f:
-                f.write(export_content)
+                f.writelines(export_parts)
             
-            # 保存导出记录
-            self._save_export_record(file_path, export_content)
+            # 保存导出记录（只需要内容预览）
+            self._save_export_record(
+                file_path, len(chinese_text), len(english_text),
+                *_content_preview(export_parts)
+            )
             
             # 显示成功消息
             QMessageBox.information(self, "导出成功", 
@@ -827,44 +1181,18 @@ class SubtitleDisplay(QMainWindow):
             logger.error(error_msg)
             QMessageBox.critical(self, "导出错误", error_msg)
     
-    def _save_export_record(self, file_path, content):
-        """保存导出记录到历史文件"""
-        try:
-            # 创建导出记录目录
-            export_dir = os.path.join(os.path.dirname(__file__), "export_history")
-            os.makedirs(export_dir, exist_ok=True)
-            
-            # 导出记录文件路径
-            record_file = os.path.join(export_dir, "export_history.json")
-            
-            # 读取现有记录
-            records = []
-            if os.path.exists(record_file):
-                with open(record_file, 'r', encoding='utf-8') as f:
-                    records = json.load(f)
-            
-            # 添加新记录
-            new_record = {
-                "timestamp": datetime.datetime.now().isoformat(),
-                "file_path": file_path,
-                "chinese_length": len(self.chinese_text),
-                "english_length": len(self.english_text),
-                "content_preview": content[:200] + "..." if len(content) > 200 else content
-            }
-            
-            records.append(new_record)
-            
-            # 只保留最近50条记录
-            if len(records) > 50:
-                records = records[-50:]
-            
-            # 保存记录
-            with open(record_file, 'w', encoding='utf-8') as f:
-                json.dump(records, f, ensure_ascii=False, indent=2)
-            
-            logger.info(f"导出记录已保存: {record_file}")
-            
-        except Exception as e:
-            logger.error(f"保存导出记录时出错: {e}")
-            # 不中断主流程，记录错误即可
-
+    def _save_export_record(self, file_path, chinese_length, english_length,
+                            content_preview, content_truncated):
+        """保存导出记录到历史文件（交给后台线程写入，不阻塞界面）
+        
+        记录中只包含导出时已算好的值，后台线程不会再访问界面对象。
+        """
+        new_record = {
+            "timestamp": _now().isoformat(),
+            "file_path": file_path,
+            "chinese_length": chinese_length,
+            "english_length": english_length,
+            "content_preview": content_preview,
+            "content_truncated": content_truncated
+        }
+        _export_history_writer.submit(new_record)